@@ -0,0 +1,112 @@
+"""Ejecución de cálculos fuera del hilo de Tk
+
+Tk solo puede tocarse desde el hilo del mainloop, así que el trabajo pesado
+(análisis de las entradas, NumPy y explicaciones) se envía a un executor y el
+resultado se recoge consultando el futuro con root.after. Solo el trabajo más
+reciente entrega su resultado: al enviar uno nuevo, el anterior se cancela si
+aún no empezó o se descarta al terminar.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from latency_trace import NULL_TRACE
+
+POLL_INTERVAL_MS = 10
+
+def _run_traced(trace, function, *args):
+    # Espera en la cola del executor y duración del cálculo
+    trace.mark("cola")
+    result = function(*args)
+    trace.mark("calculo")
+    return result
+
+class BackgroundWorker:
+    """Ejecuta un trabajo a la vez fuera del hilo de Tk y entrega su resultado en él
+
+    on_busy(ocupado) se llama en el hilo de Tk al empezar y al terminar, para
+    mostrar u ocultar un indicador. Por defecto se usa un hilo; puede pasarse
+    otro executor (p. ej. un ProcessPoolExecutor, con funciones serializables).
+    """
+
+    def __init__(self, root, on_busy=None, executor=None):
+        self.root = root
+        self.on_busy = on_busy
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="calculo")
+        self._owns_executor = executor is None
+        self._generation = 0
+        self._job = None
+        self._poll_id = None
+
+    @property
+    def busy(self):
+        return self._job is not None
+
+    def submit(self, function, *args, on_success, on_error=None, trace=NULL_TRACE):
+        """Envía function(*args) y reemplaza cualquier trabajo pendiente
+
+        on_success(resultado) u on_error(excepción) se llaman en el hilo de Tk.
+        Con una traza (ver latency_trace) se marcan las fases de cola, cálculo
+        y entrega; con un executor de procesos solo llega la de entrega.
+        Devuelve el número de generación del trabajo.
+        """
+        was_busy = self._drop_job()
+        self._generation += 1
+        if trace is NULL_TRACE:
+            future = self._executor.submit(function, *args)
+        else:
+            future = self._executor.submit(_run_traced, trace, function, *args)
+        self._job = (self._generation, future, on_success, on_error, trace)
+        if not was_busy:
+            self._set_busy(True)
+        self._schedule_poll()
+        return self._generation
+
+    def cancel(self):
+        """Abandona el trabajo actual; su resultado ya no se entregará"""
+        if self._drop_job():
+            self._set_busy(False)
+
+    def shutdown(self):
+        """Cancela lo pendiente y libera el executor si es propio"""
+        self.cancel()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _drop_job(self):
+        """Olvida el trabajo actual sin tocar el indicador; indica si había uno"""
+        if self._job is None:
+            return False
+        _, future, _, _, _ = self._job
+        future.cancel()
+        self._job = None
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        return True
+
+    def _schedule_poll(self):
+        if self._poll_id is None:
+            self._poll_id = self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        self._poll_id = None
+        if self._job is None:
+            return
+        generation, future, on_success, on_error, trace = self._job
+        if not future.done():
+            self._schedule_poll()
+            return
+
+        self._job = None
+        self._set_busy(False)
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(e)
+        else:
+            trace.mark("entrega")
+            on_success(result)
+
+    def _set_busy(self, busy):
+        if self.on_busy is not None:
+            self.on_busy(busy)
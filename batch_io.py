@@ -0,0 +1,157 @@
+import sys
+import itertools
+import contextlib
+import numpy as np
+from vector_parser import _describe_error
+
+DEFAULT_CHUNK_SIZE = 65536
+
+def add_batch_arguments(parser):
+    """Añade al parser las opciones comunes del modo por lotes"""
+    parser.add_argument(
+        "--lote", metavar="ENTRADA",
+        help="archivo CSV/TSV o .npy a procesar sin interacción ('-' para leer de stdin)"
+    )
+    parser.add_argument(
+        "--salida", metavar="SALIDA", default="-",
+        help="archivo CSV/TSV o .npy donde escribir los resultados (por defecto stdout)"
+    )
+    parser.add_argument(
+        "--tamano-bloque", metavar="N", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"filas procesadas por bloque (por defecto {DEFAULT_CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--metricas", metavar="RUTA",
+        help="guarda al terminar las estadísticas de llamadas (.prom para Prometheus, si no JSON)"
+    )
+
+def detect_delimiter(path):
+    """Tabulador para archivos .tsv, coma en cualquier otro caso"""
+    return "\t" if str(path).lower().endswith(".tsv") else ","
+
+def open_text_input(path):
+    """Abre la entrada de texto; '-' representa stdin"""
+    if path == "-":
+        return contextlib.nullcontext(sys.stdin)
+    return open(path, "r", encoding="utf-8")
+
+def open_text_output(path):
+    """Abre la salida de texto; '-' representa stdout"""
+    if path == "-":
+        return contextlib.nullcontext(sys.stdout)
+    return open(path, "w", encoding="utf-8")
+
+def iter_text_chunks(stream, chunk_size=DEFAULT_CHUNK_SIZE, delimiter=None):
+    """Genera bloques (n, m) de float64 leyendo a lo sumo chunk_size líneas cada vez
+
+    Las líneas vacías y las que empiezan por '#' se ignoran. Todas las filas
+    deben tener el mismo número de columnas. Sin delimitador explícito se usa
+    tabulador si la primera fila lo contiene y coma en caso contrario. Los
+    errores indican la línea del archivo, no la fila dentro del bloque.
+    """
+    if chunk_size < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1")
+    n_columns = None
+    lines_read = 0
+    while True:
+        lines = list(itertools.islice(stream, chunk_size))
+        if not lines:
+            return
+        numbered = [(lines_read + i, line) for i, line in enumerate(lines, 1)
+                    if line.strip() and not line.lstrip().startswith("#")]
+        lines_read += len(lines)
+        if not numbered:
+            continue
+        line_numbers = [number for number, _ in numbered]
+        lines = [line for _, line in numbered]
+        if delimiter is None:
+            delimiter = "\t" if "\t" in lines[0] else ","
+        expected = n_columns if n_columns is not None else len(lines[0].split(delimiter))
+        try:
+            chunk = np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+        except ValueError:
+            raise ValueError(_describe_error(lines, delimiter, expected, line_numbers)) from None
+        if n_columns is None:
+            n_columns = chunk.shape[1]
+        elif chunk.shape[1] != n_columns:
+            raise ValueError(f"La línea {line_numbers[0]} tiene {chunk.shape[1]} columnas y se esperaban {n_columns}")
+        yield chunk
+
+def is_npy(path):
+    """Indica si la ruta corresponde a un archivo binario .npy"""
+    return str(path).lower().endswith(".npy")
+
+def open_npy_input(path):
+    """Abre un .npy como memoria mapeada de solo lectura, con una fila por caso
+
+    Los arreglos de más de dos dimensiones, por ejemplo (N, k, d), se ven como
+    (N, k·d); la conversión se hace por bloque, nunca sobre el archivo completo.
+    """
+    array = np.load(path, mmap_mode="r")
+    if array.ndim == 1:
+        raise ValueError("El archivo .npy debe tener al menos dos dimensiones (una fila por caso)")
+    return array
+
+def iter_npy_chunks(array, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Genera vistas (n, m) consecutivas de un arreglo mapeado en memoria
+
+    Un arreglo sin filas da un único bloque (0, m), para que la salida se
+    escriba igualmente con el ancho que le corresponde.
+    """
+    if chunk_size < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1")
+    if array.shape[0] == 0:
+        yield np.empty((0, int(np.prod(array.shape[1:]))), dtype=array.dtype)
+        return
+    for start in range(0, array.shape[0], chunk_size):
+        chunk = array[start:start + chunk_size]
+        yield chunk.reshape(chunk.shape[0], -1)
+
+def _write_text(results, destination):
+    """Escribe cada bloque de resultados como texto en cuanto se produce"""
+    delimiter = detect_delimiter(destination)
+    n_rows = 0
+    with open_text_output(destination) as salida:
+        for result in results:
+            np.savetxt(salida, result, delimiter=delimiter, fmt="%.10g")
+            salida.flush()
+            n_rows += result.shape[0]
+    return n_rows
+
+def _write_npy(results, destination, n_total):
+    """Escribe los bloques en un .npy mapeado en memoria reservado con n_total filas"""
+    output = None
+    n_rows = 0
+    for result in results:
+        if output is None:
+            # El ancho de la salida se conoce con el primer bloque
+            output = np.lib.format.open_memmap(
+                destination, mode="w+", dtype=np.float64, shape=(n_total, result.shape[1])
+            )
+        output[n_rows:n_rows + result.shape[0]] = result
+        n_rows += result.shape[0]
+    if output is not None:
+        output.flush()
+        del output
+    return n_rows
+
+def run_batch(process_chunk, source, destination="-", chunk_size=DEFAULT_CHUNK_SIZE):
+    """Procesa source bloque a bloque y escribe cada resultado en cuanto está listo
+
+    process_chunk recibe un bloque (n, m) y devuelve un arreglo (n, r) con los
+    resultados de cada fila. Solo hay un bloque en memoria a la vez, así que el
+    consumo no depende del tamaño de la entrada. Las rutas .npy se leen y se
+    escriben como memoria mapeada. Devuelve el número de filas.
+    """
+    if is_npy(source):
+        array = open_npy_input(source)
+        results = (process_chunk(chunk) for chunk in iter_npy_chunks(array, chunk_size))
+        if is_npy(destination):
+            return _write_npy(results, destination, array.shape[0])
+        return _write_text(results, destination)
+
+    if is_npy(destination):
+        raise ValueError("La salida .npy requiere una entrada .npy")
+    with open_text_input(source) as entrada:
+        results = (process_chunk(chunk) for chunk in iter_text_chunks(entrada, chunk_size))
+        return _write_text(results, destination)
@@ -0,0 +1,101 @@
+"""Mide el tiempo desde el import hasta el primer frame de cada aplicación gráfica
+
+Cada medición se hace en un intérprete nuevo para que los imports sean en frío.
+Uso:
+    python benchmarks/startup.py [--repeticiones N] [--presupuesto-ms MS] [--salida archivo.json]
+
+Con --presupuesto-ms el script termina con código 1 si la mediana de alguna
+aplicación supera el presupuesto, de modo que puede usarse para detectar
+regresiones en el tiempo hasta que la ventana es interactiva.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+APPS = [
+    ("linear_independence", "VectorApp"),
+    ("orthogonal_projection", "VectorProjectionApp"),
+    ("parallelepiped_volume", "ParallelepipedApp"),
+]
+
+# Programa que ejecuta cada proceso hijo: importa la aplicación, crea la
+# ventana y procesa los eventos pendientes hasta que el primer frame se dibuja
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import importlib
+import tkinter as tk
+module = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+root = tk.Tk()
+app = getattr(module, sys.argv[2])(root)
+root.update()
+first_frame = time.perf_counter()
+matplotlib_loaded = "matplotlib" in sys.modules
+root.destroy()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_frame_ms": (first_frame - start) * 1000,
+    "matplotlib_loaded": matplotlib_loaded,
+}))
+"""
+
+def measure(module_name, class_name):
+    """Lanza un intérprete nuevo y devuelve sus tiempos de arranque"""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, module_name, class_name],
+        cwd=REPO_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"No se pudo medir {module_name}:\n{result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def run(repetitions):
+    """Mide cada aplicación varias veces y resume las medidas"""
+    report = {}
+    for module_name, class_name in APPS:
+        samples = [measure(module_name, class_name) for _ in range(repetitions)]
+        first_frame = [sample["first_frame_ms"] for sample in samples]
+        report[module_name] = {
+            "repetitions": repetitions,
+            "import_ms_median": statistics.median(sample["import_ms"] for sample in samples),
+            "first_frame_ms_median": statistics.median(first_frame),
+            "first_frame_ms_min": min(first_frame),
+            "first_frame_ms_max": max(first_frame),
+            "matplotlib_loaded_at_first_frame": any(sample["matplotlib_loaded"] for sample in samples),
+        }
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de arranque de las aplicaciones gráficas")
+    parser.add_argument("--repeticiones", type=int, default=5, help="mediciones por aplicación (por defecto 5)")
+    parser.add_argument("--presupuesto-ms", type=float, help="mediana máxima admitida hasta el primer frame")
+    parser.add_argument("--salida", help="archivo JSON donde guardar el informe")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeticiones)
+    text = json.dumps(report, indent=2)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+    if args.presupuesto_ms is not None:
+        over_budget = [
+            name for name, stats in report.items()
+            if stats["first_frame_ms_median"] > args.presupuesto_ms
+        ]
+        for name in over_budget:
+            print(f"❌ {name}: {report[name]['first_frame_ms_median']:.1f} ms supera el presupuesto "
+                  f"de {args.presupuesto_ms:.1f} ms", file=sys.stderr)
+        if over_budget:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
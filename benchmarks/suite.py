@@ -0,0 +1,286 @@
+"""Mide latencia y rendimiento de los cálculos, el análisis de texto, las explicaciones y los gráficos
+
+Uso:
+    python benchmarks/suite.py [--filtro TEXTO] [--muestras N] [--salida informe.json]
+    python benchmarks/suite.py --comparar base.json [--tolerancia 0.25]
+
+Cada caso se repite en lotes calibrados para durar al menos --min-ms y se
+reportan percentiles de la latencia (p50, p90, p99), llamadas por segundo y,
+en los casos por lotes, filas por segundo. Si una llamada dura al menos
+PER_CALL_MIN_US, cada llamada se cronometra por separado y los percentiles
+son de latencia por llamada; en los casos más rápidos el coste del reloj
+pesaría demasiado, así que cada valor es el promedio de un lote y el informe
+lo indica con per_call_timing = false. Los casos recorren
+dimensiones y tamaños de lote. Los gráficos se dibujan con las mismas escenas
+que usan draw_projection, draw_parallelepiped y draw_vectors, sobre un lienzo
+Agg sin ventana.
+
+Con --comparar el script termina con código 1 si la mediana de algún caso es
+más lenta que la del informe base en más de --tolerancia (fracción).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import numpy as np
+
+DIMENSIONS = [2, 3, 4, 16, 256, 4096]
+BATCH_SIZES = [10, 1000, 100000]
+EXPLANATION_DIMENSIONS = [3, 100, 100000]
+DRAWN_VECTORS = [3, 200, 10000]
+
+def _vectors(rng, *shape):
+    return rng.uniform(-10, 10, shape)
+
+def _square(rng, d):
+    # Escalada por 1/√d para que el determinante no desborde en dimensiones altas
+    return rng.standard_normal((d, d)) / np.sqrt(d)
+
+def kernel_cases(rng):
+    """Casos de los cálculos: llamadas sueltas por dimensión y lotes por tamaño"""
+    from linear_independence_console import (
+        analyze_vector_set, check_linear_independence, check_linear_independence_batch
+    )
+    from orthogonal_projection_console import calcular_proyeccion, calcular_proyecciones
+    from parallelepiped_volume_console import calcular_volumen, calcular_volumenes
+
+    for d in DIMENSIONS:
+        a, b = _vectors(rng, 2, d)
+        yield f"proyeccion/calcular_proyeccion/d={d}", 1, lambda a=a, b=b: calcular_proyeccion(a, b)
+    for n in BATCH_SIZES:
+        a, b = _vectors(rng, 2, n, 3)
+        yield f"proyeccion/calcular_proyecciones/n={n}", n, lambda a=a, b=b: calcular_proyecciones(a, b)
+
+    a, b, c = _vectors(rng, 3, 3)
+    yield "volumen/calcular_volumen/d=3", 1, lambda: calcular_volumen(a, b, c)
+    for n in BATCH_SIZES:
+        stack = _vectors(rng, n, 3, 3)
+        yield f"volumen/calcular_volumenes/n={n}", n, lambda stack=stack: calcular_volumenes(stack)
+
+    for d in [2, 3, 4, 16, 256]:
+        vectors = _square(rng, d)
+        yield (f"independencia/check_linear_independence/d={d}", 1,
+               lambda vectors=vectors: check_linear_independence(vectors))
+    vectors = _vectors(rng, 3, 3)
+    yield "independencia/analyze_vector_set/d=3", 1, lambda: analyze_vector_set(vectors)
+    for n in BATCH_SIZES:
+        sets = _vectors(rng, n, 3, 3)
+        yield (f"independencia/check_linear_independence_batch/n={n}", n,
+               lambda sets=sets: check_linear_independence_batch(sets))
+
+def parsing_cases(rng):
+    """Análisis del texto de un vector, como en ingresar_vector y los campos de las ventanas"""
+    from vector_parser import parse_vector
+
+    for d in [3, 100, 10000]:
+        text = ", ".join(f"{x:.6f}" for x in _vectors(rng, d))
+        yield f"texto/parse_vector/d={d}", 1, lambda text=text: parse_vector(text)
+
+def explanation_cases(rng):
+    """Construcción del texto de las explicaciones de las tres ventanas"""
+    from linear_independence import analysis_explanation
+    from orthogonal_projection import generate_explanation as projection_explanation
+    from orthogonal_projection_console import calcular_proyeccion
+    from parallelepiped_volume import generate_explanation as volume_explanation
+    from parallelepiped_volume_console import calcular_volumen
+
+    for d in EXPLANATION_DIMENSIONS:
+        a, b = _vectors(rng, 2, d)
+        projection, dot_product, b_norm_squared, _ = calcular_proyeccion(a, b)
+        yield (f"explicacion/proyeccion/d={d}", 1,
+               lambda a=a, b=b, p=projection, dot=dot_product, bb=b_norm_squared:
+               projection_explanation(a, b, dot, bb, p))
+
+    a, b, c = _vectors(rng, 3, 3)
+    volume, cross_product, scalar_triple = calcular_volumen(a, b, c)
+    yield ("explicacion/volumen/d=3", 1,
+           lambda: volume_explanation(a, b, c, cross_product, scalar_triple, volume))
+
+    for d in [3, 100, 1000]:
+        matrix = _square(rng, d)
+        det = np.linalg.det(matrix)
+        yield (f"explicacion/independencia/d={d}", 1,
+               lambda matrix=matrix, det=det, d=d: analysis_explanation(matrix, d, det))
+
+def plot_cases(rng):
+    """Actualización y dibujo completo de cada escena en un lienzo Agg"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from orthogonal_projection_console import calcular_proyeccion
+    from plot_scenes import ParallelepipedScene, ProjectionScene, VectorScene
+
+    def figure(projection=None):
+        fig = Figure(figsize=(6, 4), dpi=100)
+        FigureCanvasAgg(fig)
+        return fig, fig.add_subplot(111, projection=projection)
+
+    fig, ax = figure()
+    scene = ProjectionScene(ax)
+    for d in [2, 3]:
+        a, b = _vectors(rng, 2, d)
+        projection = calcular_proyeccion(a, b)[0]
+
+        def draw_projection(a=a, b=b, projection=projection, fig=fig, scene=scene):
+            scene.update(a, b, projection)
+            fig.canvas.draw()
+        yield f"grafico/draw_projection/d={d}", 1, draw_projection
+
+    fig, ax = figure('3d')
+    scene = ParallelepipedScene(ax)
+    a, b, c = _vectors(rng, 3, 3)
+
+    def draw_parallelepiped():
+        scene.update(a, b, c)
+        fig.canvas.draw()
+    yield "grafico/draw_parallelepiped/d=3", 1, draw_parallelepiped
+
+    fig, ax = figure('3d')
+    scene = VectorScene(ax)
+    for n in DRAWN_VECTORS:
+        vectors = _vectors(rng, n, 3)
+
+        def draw_vectors(vectors=vectors, fig=fig, scene=scene):
+            scene.update(vectors)
+            fig.canvas.draw()
+        yield f"grafico/draw_vectors/n={n}", n, draw_vectors
+
+CASE_GROUPS = [kernel_cases, parsing_cases, explanation_cases, plot_cases]
+
+# Duración mínima por llamada (µs) para cronometrar cada llamada por separado
+PER_CALL_MIN_US = 20
+
+def calibrate(function, min_seconds):
+    """Llamadas por muestra para que cada muestra dure al menos min_seconds, y su duración"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return number, elapsed
+        number *= 2 if elapsed == 0 else max(2, min(10, int(1.2 * min_seconds / elapsed) + 1))
+
+def percentile(sorted_values, fraction):
+    """Percentil con interpolación lineal de una lista ya ordenada"""
+    position = (len(sorted_values) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+def measure(function, rows, samples, min_seconds):
+    """Latencia (en microsegundos) de function y su rendimiento
+
+    Con llamadas de al menos PER_CALL_MIN_US se guarda la duración de cada una;
+    si no, el promedio de cada muestra de calls_per_sample llamadas.
+    """
+    function()  # calentamiento: imports perezosos, cachés y primer dibujo
+    number, elapsed = calibrate(function, min_seconds)
+    per_call = elapsed / number * 1e6 >= PER_CALL_MIN_US
+    latencies = []
+    for _ in range(samples):
+        if per_call:
+            for _ in range(number):
+                start = time.perf_counter()
+                function()
+                latencies.append((time.perf_counter() - start) * 1e6)
+        else:
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            latencies.append((time.perf_counter() - start) / number * 1e6)
+    latencies.sort()
+    p50 = percentile(latencies, 0.5)
+    result = {
+        "calls_per_sample": number,
+        "samples": samples,
+        "per_call_timing": per_call,
+        "timings": len(latencies),
+        "min_us": latencies[0],
+        "mean_us": statistics.fmean(latencies),
+        "p50_us": p50,
+        "p90_us": percentile(latencies, 0.9),
+        "p99_us": percentile(latencies, 0.99),
+        "max_us": latencies[-1],
+        "calls_per_s": 1e6 / p50,
+    }
+    if rows > 1:
+        result["rows"] = rows
+        result["rows_per_s"] = rows * 1e6 / p50
+    return result
+
+def environment():
+    import matplotlib
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def run(name_filter=None, samples=20, min_ms=2.0, seed=0):
+    """Ejecuta los casos cuyo nombre contiene name_filter y devuelve el informe"""
+    rng = np.random.default_rng(seed)
+    results = {}
+    for group in CASE_GROUPS:
+        for name, rows, function in group(rng):
+            if name_filter and name_filter not in name:
+                continue
+            results[name] = measure(function, rows, samples, min_ms / 1000)
+            print(f"{name}: p50 {results[name]['p50_us']:.2f} µs", file=sys.stderr)
+    return {"environment": environment(), "results": results}
+
+def compare(report, baseline, tolerance):
+    """Casos cuya mediana empeora más de tolerance respecto a la base: (nombre, base, actual)"""
+    regressions = []
+    for name, stats in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        if stats["p50_us"] > reference["p50_us"] * (1 + tolerance):
+            regressions.append((name, reference["p50_us"], stats["p50_us"]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de cálculos, texto, explicaciones y gráficos")
+    parser.add_argument("--filtro", help="solo los casos cuyo nombre contiene este texto (p. ej. 'volumen/')")
+    parser.add_argument("--muestras", type=int, default=20, help="muestras por caso (por defecto 20)")
+    parser.add_argument("--min-ms", type=float, default=2.0, help="duración mínima de cada muestra (por defecto 2 ms)")
+    parser.add_argument("--salida", help="archivo JSON donde guardar el informe")
+    parser.add_argument("--comparar", metavar="BASE", help="informe JSON previo con el que comparar")
+    parser.add_argument(
+        "--tolerancia", type=float, default=0.25,
+        help="empeoramiento relativo admitido de la mediana con --comparar (por defecto 0.25)"
+    )
+    args = parser.parse_args(argv)
+    if args.muestras < 1:
+        parser.error("--muestras debe ser al menos 1")
+
+    report = run(args.filtro, args.muestras, args.min_ms)
+    text = json.dumps(report, indent=2)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerancia)
+        for name, before, after in regressions:
+            print(f"❌ {name}: {after:.2f} µs frente a {before:.2f} µs de la base "
+                  f"({(after / before - 1) * 100:+.0f} %)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+"""Servicio HTTP local (JSON) para proyecciones, volúmenes e independencia lineal
+
+Uso:
+    python calculation_server.py [--host 127.0.0.1] [--puerto 8080] [--procesos N]
+
+Rutas (todas con POST y cuerpo JSON):
+    /proyeccion     {"a": [...], "b": [...]}            un caso
+                    {"a": [[...], ...], "b": [...] o [[...], ...]}   lote
+    /volumen        {"a": [x, y, z], "b": [...], "c": [...]}        un caso
+                    {"a": [[x, y, z], ...], "b": [...], "c": [...]}  lote
+    /independencia  {"vectores": [[...], ...]}          un conjunto
+                    {"vectores": [[[...], ...], ...]}   lote de conjuntos
+
+En los lotes los valores no definidos (proyección sobre b = 0, determinante de
+conjuntos no cuadrados) se devuelven como null. Las conexiones HTTP/1.1 se
+mantienen abiertas entre peticiones. Los cuerpos grandes se decodifican,
+calculan y codifican en un ProcessPoolExecutor para no bloquear el bucle de
+eventos; si ya hay demasiados en curso se responde 503 en lugar de encolarlos.
+"""
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from linear_independence_console import check_linear_independence, check_linear_independence_batch
+from orthogonal_projection_console import calcular_proyeccion, calcular_proyecciones
+from parallelepiped_volume_console import calcular_volumen, calcular_volumenes
+
+# Tamaño máximo del cuerpo de una petición (413 por encima)
+MAX_BODY_BYTES = 8 * 1024 * 1024
+# Tamaño máximo de la línea de petición más las cabeceras (431 por encima)
+MAX_HEADER_BYTES = 16 * 1024
+# Cuerpos a partir de este tamaño se procesan en el grupo de procesos
+OFFLOAD_BYTES = 64 * 1024
+# Trabajos en el grupo de procesos por proceso antes de responder 503
+PENDING_PER_PROCESS = 4
+# Segundos que una conexión inactiva permanece abierta (y que se espera cada cuerpo)
+KEEPALIVE_TIMEOUT = 15
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+def _array(payload, name, dims):
+    """Campo name del JSON como arreglo float con alguna de las dimensiones dims"""
+    if name not in payload:
+        raise ValueError(f"Falta el campo '{name}'")
+    try:
+        array = np.asarray(payload[name], dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(f"El campo '{name}' debe contener solo números en listas rectangulares")
+    if array.ndim not in dims:
+        raise ValueError(f"El campo '{name}' tiene {array.ndim} niveles de listas y se esperaban {' o '.join(map(str, dims))}")
+    if array.size == 0:
+        raise ValueError(f"El campo '{name}' está vacío")
+    return array
+
+def _nullable(array):
+    """Lista JSON de un arreglo con NaN convertidos en null (por filas si es 2D)"""
+    array = np.asarray(array)
+    if array.ndim == 2:
+        rows = array.tolist()
+        for i in np.flatnonzero(np.isnan(array).any(axis=1)):
+            rows[i] = None
+        return rows
+    values = array.astype(object)
+    values[np.isnan(array)] = None
+    return values.tolist()
+
+def _projection(payload):
+    a = _array(payload, "a", (1, 2))
+    b = _array(payload, "b", (1, 2))
+    if a.ndim == 1:
+        if b.shape != a.shape:
+            raise ValueError(f"a y b deben tener el mismo número de componentes ({a.size} y {b.size})")
+        projection, dot_product, b_norm_squared, factor = calcular_proyeccion(a, b)
+        return {
+            "proyeccion": projection.tolist(),
+            "producto_punto": float(dot_product),
+            "norma_b_cuadrado": float(b_norm_squared),
+            "factor_escalar": float(factor),
+        }
+    projections, dot_products, b_norms_squared, factors = calcular_proyecciones(a, b)
+    return {
+        "proyeccion": _nullable(projections),
+        "producto_punto": dot_products.tolist(),
+        "norma_b_cuadrado": b_norms_squared.tolist(),
+        "factor_escalar": _nullable(factors),
+    }
+
+def _volume(payload):
+    a = _array(payload, "a", (1, 2))
+    b = _array(payload, "b", (a.ndim,))
+    c = _array(payload, "c", (a.ndim,))
+    if a.ndim == 1:
+        if not a.shape == b.shape == c.shape == (3,):
+            raise ValueError("a, b y c deben tener exactamente 3 componentes")
+        volume, cross_product, scalar_triple = calcular_volumen(a, b, c)
+        return {
+            "volumen": float(volume),
+            "producto_vectorial": cross_product.tolist(),
+            "producto_triple": float(scalar_triple),
+        }
+    volumes, cross_products, scalar_triples = calcular_volumenes(a, b, c)
+    return {
+        "volumen": volumes.tolist(),
+        "producto_vectorial": cross_products.tolist(),
+        "producto_triple": scalar_triples.tolist(),
+    }
+
+def _independence(payload):
+    vectors = _array(payload, "vectores", (2, 3))
+    if vectors.ndim == 2:
+        independent, explanation = check_linear_independence(vectors)
+        return {"independiente": bool(independent), "explicacion": explanation}
+    independent, ranks, dets = check_linear_independence_batch(vectors)
+    return {
+        "independiente": independent.tolist(),
+        "rango": ranks.tolist(),
+        "determinante": _nullable(dets),
+    }
+
+ROUTES = {
+    "/proyeccion": _projection,
+    "/volumen": _volume,
+    "/independencia": _independence,
+}
+
+def _encode(payload):
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+def process_request(path, body):
+    """Decodifica, calcula y codifica una petición; devuelve (estado, cuerpo JSON)
+
+    Es una función de módulo para poder ejecutarse en otro proceso.
+    """
+    handler = ROUTES.get(path)
+    if handler is None:
+        return 404, _encode({"error": f"Ruta desconocida: {path}"})
+    try:
+        payload = json.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("El cuerpo debe ser un objeto JSON")
+        return 200, _encode(handler(payload))
+    except ValueError as e:
+        # json.JSONDecodeError también es un ValueError
+        return 400, _encode({"error": str(e)})
+    except Exception as e:
+        # Un fallo inesperado de un cálculo no debe cerrar la conexión sin respuesta
+        return 500, _encode({"error": f"Error interno: {e}"})
+
+class CalculationServer:
+    """Servidor HTTP/1.1 con conexiones persistentes sobre asyncio
+
+    Cada conexión atiende sus peticiones en orden y espera a que el cliente
+    lea cada respuesta (drain) antes de leer la siguiente, así que un cliente
+    lento no acumula respuestas en memoria. Los cuerpos de OFFLOAD_BYTES o más
+    van al grupo de procesos, con como mucho max_pending trabajos a la vez.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8080, processes=None, max_body_bytes=MAX_BODY_BYTES,
+                 max_pending=None):
+        self.host = host
+        self.port = port
+        self.processes = processes or os.cpu_count() or 1
+        self.max_body_bytes = max_body_bytes
+        self.max_pending = max_pending or PENDING_PER_PROCESS * self.processes
+        self._executor = None
+        self._slots = None
+        self._server = None
+
+    async def start(self):
+        self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        return self._server
+
+    @property
+    def sockets(self):
+        return self._server.sockets if self._server is not None else ()
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            keep_alive = True
+            while keep_alive:
+                keep_alive = await self.handle_request(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_request(self, reader, writer):
+        """Atiende una petición de la conexión; devuelve si debe seguir abierta"""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+        except asyncio.IncompleteReadError as e:
+            if e.partial.strip():
+                raise
+            return False  # el cliente cerró la conexión entre peticiones
+        except asyncio.LimitOverrunError:
+            await self.respond(writer, 431, _encode({"error": "Cabeceras demasiado grandes"}), False)
+            return False
+
+        try:
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, path, version = request_line.split(" ")
+            headers = {}
+            for line in header_lines:
+                if line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            await self.respond(writer, 400, _encode({"error": "Petición HTTP mal formada"}), False)
+            return False
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+
+        if "transfer-encoding" in headers:
+            await self.respond(writer, 411, _encode({"error": "Se requiere Content-Length"}), False)
+            return False
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            await self.respond(writer, 400, _encode({"error": "Content-Length inválido"}), False)
+            return False
+        if length < 0:
+            await self.respond(writer, 400, _encode({"error": "Content-Length inválido"}), False)
+            return False
+        if length > self.max_body_bytes:
+            # El cuerpo no se lee, así que la conexión no puede reutilizarse
+            message = f"El cuerpo ocupa {length} bytes y el máximo es {self.max_body_bytes}"
+            await self.respond(writer, 413, _encode({"error": message}), False)
+            return False
+        body = await asyncio.wait_for(reader.readexactly(length), KEEPALIVE_TIMEOUT)
+
+        path = path.split("?", 1)[0]
+        if method != "POST":
+            status = 404 if path not in ROUTES else 405
+            await self.respond(writer, status, _encode({"error": f"Use POST en {' '.join(ROUTES)}"}),
+                               keep_alive, extra_headers={"Allow": "POST"} if status == 405 else None)
+            return keep_alive
+
+        status, response = await self.dispatch(path, body)
+        await self.respond(writer, status, response, keep_alive,
+                           extra_headers={"Retry-After": "1"} if status == 503 else None)
+        return keep_alive
+
+    async def dispatch(self, path, body):
+        """Procesa el cuerpo en el bucle si es pequeño o en el grupo de procesos si no"""
+        if len(body) < OFFLOAD_BYTES or path not in ROUTES:
+            return process_request(path, body)
+        if self._slots.locked():
+            return 503, _encode({"error": "Servidor ocupado, reintente más tarde"})
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(self._executor, process_request, path, body)
+            except Exception as e:
+                return 500, _encode({"error": f"Error interno: {e}"})
+
+    async def respond(self, writer, status, body, keep_alive, extra_headers=None):
+        lines = [
+            f"HTTP/1.1 {status} {REASONS[status]}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive" if keep_alive else "Connection: close",
+        ]
+        for name, value in (extra_headers or {}).items():
+            lines.append(f"{name}: {value}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP local con los cálculos vectoriales")
+    parser.add_argument("--host", default="127.0.0.1", help="dirección de escucha (por defecto 127.0.0.1)")
+    parser.add_argument("--puerto", type=int, default=8080, help="puerto de escucha (por defecto 8080)")
+    parser.add_argument(
+        "--procesos", metavar="N", type=int, default=0,
+        help="procesos para los lotes grandes (0 = uno por CPU; por defecto 0)"
+    )
+    parser.add_argument(
+        "--max-cuerpo", metavar="BYTES", type=int, default=MAX_BODY_BYTES,
+        help=f"tamaño máximo del cuerpo de una petición (por defecto {MAX_BODY_BYTES})"
+    )
+    args = parser.parse_args(argv)
+
+    server = CalculationServer(args.host, args.puerto, args.procesos or None, args.max_cuerpo)
+
+    async def run():
+        await server.start()
+        print(f"Escuchando en http://{args.host}:{args.puerto}", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
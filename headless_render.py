@@ -0,0 +1,166 @@
+"""Renderizado sin ventana de proyecciones y paralelepípedos a archivos PNG/SVG
+
+Uso:
+    python headless_render.py proyeccion ENTRADA DIRECTORIO [--formato png|svg] [--procesos N]
+    python headless_render.py volumen ENTRADA DIRECTORIO [--formato png|svg] [--procesos N]
+
+ENTRADA tiene el mismo formato que --lote en las consolas (CSV/TSV, .npy o '-'
+para stdin): filas a,b para proyecciones y a,b,c para volúmenes. Cada fila
+produce DIRECTORIO/<tipo>_<fila>.<formato>. Se usa el backend Agg sin pyplot:
+cada proceso crea una sola figura con sus artistas (ver plot_scenes) y la
+reutiliza para todas sus filas. No se generan explicaciones.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+from batch_io import DEFAULT_CHUNK_SIZE, is_npy, open_npy_input, iter_npy_chunks, open_text_input, iter_text_chunks
+from orthogonal_projection_console import calcular_proyecciones
+
+# Filas por tarea enviada a un proceso trabajador
+ROWS_PER_TASK = 64
+
+class SceneRenderer:
+    """Figura Agg con una escena persistente que se actualiza y guarda fila a fila"""
+
+    def __init__(self, kind, directory, file_format="png", dpi=100):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from plot_scenes import ProjectionScene, ParallelepipedScene
+
+        self.kind = kind
+        self.directory = directory
+        self.file_format = file_format
+        self.dpi = dpi
+        self.figure = Figure(figsize=(6, 4), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        if kind == "proyeccion":
+            self.scene = ProjectionScene(self.figure.add_subplot(111))
+        elif kind == "volumen":
+            self.scene = ParallelepipedScene(self.figure.add_subplot(111, projection='3d'))
+        else:
+            raise ValueError(f"Tipo de gráfico desconocido: {kind}")
+
+    def path(self, index):
+        return os.path.join(self.directory, f"{self.kind}_{index:06d}.{self.file_format}")
+
+    def render_chunk(self, start, chunk):
+        """Dibuja y guarda las filas de chunk numeradas desde start; devuelve (guardadas, omitidas)"""
+        if self.kind == "proyeccion":
+            if chunk.shape[1] % 2 != 0:
+                raise ValueError("Cada fila debe contener a y b con el mismo número de componentes")
+            d = chunk.shape[1] // 2
+            a, b = chunk[:, :d], chunk[:, d:]
+            projections, _, _, _, b_zero = calcular_proyecciones(a, b, devolver_mascara=True)
+            cases = ((a[i], b[i], projections[i]) for i in range(len(chunk)))
+            skip = b_zero
+        else:
+            if chunk.shape[1] != 9:
+                raise ValueError("Cada fila debe contener exactamente 9 componentes (a, b y c)")
+            cases = iter(chunk.reshape(-1, 3, 3))
+            skip = np.zeros(len(chunk), dtype=bool)
+
+        saved = 0
+        for i, case in enumerate(cases):
+            if skip[i]:
+                # Sin proyección definida (b = 0): no hay nada que dibujar
+                continue
+            self.scene.update(*case)
+            self.figure.savefig(self.path(start + i), format=self.file_format, dpi=self.dpi)
+            saved += 1
+        return saved, len(chunk) - saved
+
+# Renderizador del proceso actual, creado una vez por proceso trabajador
+_renderer = None
+
+def _init_worker(kind, directory, file_format, dpi):
+    global _renderer
+    _renderer = SceneRenderer(kind, directory, file_format, dpi)
+
+def _render_task(start, chunk):
+    return _renderer.render_chunk(start, chunk)
+
+def iter_input_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Bloques (n, m) de la entrada, leídos igual que en el modo por lotes"""
+    if is_npy(source):
+        yield from iter_npy_chunks(open_npy_input(source), chunk_size)
+    else:
+        with open_text_input(source) as entrada:
+            yield from iter_text_chunks(entrada, chunk_size)
+
+def iter_tasks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Divide la entrada en tareas (primera_fila, bloque) de ROWS_PER_TASK filas"""
+    start = 0
+    for chunk in iter_input_chunks(source, chunk_size):
+        for offset in range(0, len(chunk), ROWS_PER_TASK):
+            # Copia contigua: las vistas de un .npy mapeado no se envían a otros procesos
+            yield start + offset, np.ascontiguousarray(chunk[offset:offset + ROWS_PER_TASK], dtype=float)
+        start += len(chunk)
+
+def render_rows(kind, source, directory, file_format="png", dpi=100, processes=1,
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """Renderiza cada fila de source a un archivo; devuelve (guardadas, omitidas, segundos)"""
+    os.makedirs(directory, exist_ok=True)
+    started = time.perf_counter()
+    saved = skipped = 0
+
+    if processes <= 1:
+        _init_worker(kind, directory, file_format, dpi)
+        for start, chunk in iter_tasks(source, chunk_size):
+            done, omitted = _render_task(start, chunk)
+            saved += done
+            skipped += omitted
+        return saved, skipped, time.perf_counter() - started
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(kind, directory, file_format, dpi)) as executor:
+        # Como mucho dos tareas por proceso en vuelo, para no leer toda la entrada de golpe
+        pending = set()
+        for start, chunk in iter_tasks(source, chunk_size):
+            if len(pending) >= 2 * processes:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done, omitted = future.result()
+                    saved += done
+                    skipped += omitted
+            pending.add(executor.submit(_render_task, start, chunk))
+        for future in pending:
+            done, omitted = future.result()
+            saved += done
+            skipped += omitted
+    return saved, skipped, time.perf_counter() - started
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera imágenes PNG/SVG de proyecciones o paralelepípedos sin ventana")
+    parser.add_argument("tipo", choices=["proyeccion", "volumen"], help="gráfico a generar")
+    parser.add_argument("entrada", help="archivo CSV/TSV o .npy con una fila por caso ('-' para stdin)")
+    parser.add_argument("directorio", help="directorio donde guardar las imágenes")
+    parser.add_argument("--formato", choices=["png", "svg"], default="png", help="formato de imagen (por defecto png)")
+    parser.add_argument("--dpi", type=int, default=100, help="resolución de las imágenes PNG (por defecto 100)")
+    parser.add_argument(
+        "--procesos", metavar="N", type=int, default=1,
+        help="procesos que renderizan en paralelo (0 = uno por CPU; por defecto 1)"
+    )
+    parser.add_argument(
+        "--tamano-bloque", metavar="N", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"filas leídas por bloque (por defecto {DEFAULT_CHUNK_SIZE})"
+    )
+    args = parser.parse_args(argv)
+
+    processes = args.procesos if args.procesos > 0 else (os.cpu_count() or 1)
+    try:
+        saved, skipped, seconds = render_rows(
+            args.tipo, args.entrada, args.directorio, args.formato, args.dpi, processes, args.tamano_bloque
+        )
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Error: {e}")
+
+    rate = saved / seconds if seconds > 0 else float("inf")
+    print(f"{saved} imágenes en {seconds:.2f} s ({rate:.1f} imágenes/s, {processes} proceso(s))", file=sys.stderr)
+    if skipped:
+        print(f"{skipped} filas omitidas (b es el vector cero)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
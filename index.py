@@ -1,17 +1,47 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import subprocess
+import importlib
+import threading
+import sys
 import os
+from window_style import WindowStyle
+
+# Módulo y clase de cada aplicación, para abrirlas dentro del mismo intérprete
+APP_CLASSES = {
+    "parallelepiped_volume.py": ("parallelepiped_volume", "ParallelepipedApp"),
+    "orthogonal_projection.py": ("orthogonal_projection", "VectorProjectionApp"),
+    "linear_independence.py": ("linear_independence", "VectorApp"),
+}
+
+# Módulos pesados que se importan en segundo plano cuando el lanzador ya es visible
+PRELOAD_MODULES = [
+    "numpy",
+    "matplotlib.figure",
+    "mpl_toolkits.mplot3d",
+    "parallelepiped_volume",
+    "orthogonal_projection",
+    "linear_independence",
+]
+
+# Módulos que usan Tk al importarse: se importan en el hilo de Tk al terminar los anteriores
+MAIN_THREAD_PRELOAD_MODULES = [
+    "matplotlib.backends.backend_tkagg",
+]
+
+PRELOAD_POLL_MS = 50
 
 class VectorCalculusLauncher:
-    def __init__(self, root):
+    def __init__(self, root, in_process=True):
         self.root = root
+        self.in_process = in_process
         self.root.title("Lanzador de Aplicaciones Vectoriales")
         self.root.geometry("800x600")
         self.root.resizable(False, False)
         
-        # Configuración de estilo
-        self.style = ttk.Style()
+        # Configuración de estilo: con nombres propios para que las aplicaciones
+        # abiertas en este mismo intérprete no cambien el lanzador
+        self.style = WindowStyle(self.root)
         self.style.theme_use('clam')
         self.style.configure('TFrame', background='#f0f2f5')
         self.style.configure('TLabel', background='#f0f2f5', font=('Segoe UI', 10))
@@ -19,7 +49,32 @@ class VectorCalculusLauncher:
         self.style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'), foreground='#2c3e50')
         
         self.create_widgets()
-    
+        self.style.apply(self.root)
+
+        # Precargar los módulos pesados en cuanto el lanzador se haya dibujado
+        if self.in_process:
+            self.root.after(100, self.start_preload)
+
+    def start_preload(self):
+        thread = threading.Thread(target=self.preload_modules, args=(PRELOAD_MODULES,), daemon=True)
+        thread.start()
+        self.root.after(PRELOAD_POLL_MS, self.finish_preload, thread)
+
+    def finish_preload(self, thread):
+        """Espera al hilo de precarga sin bloquear Tk y sigue con los módulos de Tk"""
+        if thread.is_alive():
+            self.root.after(PRELOAD_POLL_MS, self.finish_preload, thread)
+        else:
+            self.root.after_idle(self.preload_modules, MAIN_THREAD_PRELOAD_MODULES)
+
+    def preload_modules(self, module_names):
+        for module_name in module_names:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                # Un fallo aquí se repetirá y se mostrará al abrir la aplicación
+                pass
+
     def create_widgets(self):
         # Frame principal
         main_frame = ttk.Frame(self.root, padding=20)
@@ -60,6 +115,19 @@ class VectorCalculusLauncher:
     
     def launch_app(self, app_file):
         try:
+            if self.in_process:
+                # Abrir la aplicación como ventana secundaria reutilizando los módulos ya importados
+                module_name, class_name = APP_CLASSES[app_file]
+                module = importlib.import_module(module_name)
+                app_class = getattr(module, class_name)
+                window = tk.Toplevel(self.root)
+                try:
+                    app_class(window)
+                except Exception:
+                    window.destroy()
+                    raise
+                return
+
             if not os.path.exists(app_file):
                 raise FileNotFoundError(f"Archivo {app_file} no encontrado")
             
@@ -68,7 +136,7 @@ class VectorCalculusLauncher:
             subprocess.Popen([python_exec, app_file])
             
         except Exception as e:
-            tk.messagebox.showerror(
+            messagebox.showerror(
                 "Error",
                 f"No se pudo iniciar la aplicación:\n{str(e)}\n\n"
                 f"Asegúrate que {app_file} está en el mismo directorio"
@@ -76,5 +144,6 @@ class VectorCalculusLauncher:
 
 if __name__ == "__main__":
     root = tk.Tk()
-    app = VectorCalculusLauncher(root)
+    # Con --subproceso cada aplicación se abre en su propio intérprete, como antes
+    app = VectorCalculusLauncher(root, in_process="--subproceso" not in sys.argv)
     root.mainloop()
@@ -0,0 +1,198 @@
+"""Estadísticas de llamadas de las funciones de cálculo
+
+Las funciones decoradas con @instrumented cuentan llamadas y errores y
+acumulan histogramas de latencia y de tamaño de la entrada (número total de
+componentes de sus argumentos). De las llamadas con entradas de al menos
+SAMPLE_MIN_SIZE componentes se guardan las últimas MAX_SAMPLES como muestra
+(formas, tipos y un resumen de los valores).
+
+El registro empieza desactivado salvo que se defina VECTORES_METRICAS; sin
+activar, el decorador solo comprueba una bandera antes de llamar a la función.
+Cada proceso tiene su propio registro: en un ProcessPoolExecutor se cuentan
+las llamadas del proceso principal. Las instantáneas se exportan como JSON o
+en el formato de texto de Prometheus (ver write_snapshot).
+"""
+import bisect
+import collections
+import functools
+import json
+import os
+import threading
+import time
+import numpy as np
+from text_format import format_array
+
+METRICS_ENV = "VECTORES_METRICAS"
+
+# Límites superiores de los intervalos de los histogramas (el último es +Inf)
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                   1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1, 3, 4, 10, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+SAMPLE_MIN_SIZE = 10_000
+MAX_SAMPLES = 16
+
+def input_size(args):
+    """Número de componentes de los argumentos (arreglos y listas, anidadas un nivel)"""
+    size = 0
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            size += arg.size
+        elif isinstance(arg, (list, tuple)) and arg:
+            first = arg[0]
+            size += len(arg) * (len(first) if isinstance(first, (list, tuple, np.ndarray)) else 1)
+    return size
+
+class Histogram:
+    """Histograma acumulable con límites fijos, como los de Prometheus"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def snapshot(self):
+        return {"limites": list(self.bounds), "cuentas": list(self.counts), "suma": self.total}
+
+class FunctionMetrics:
+    """Contadores, histogramas y muestras de una función"""
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+            self.latency = Histogram(LATENCY_BUCKETS)
+            self.sizes = Histogram(SIZE_BUCKETS)
+            self.samples = collections.deque(maxlen=MAX_SAMPLES)
+
+    def observe(self, seconds, args, failed):
+        size = input_size(args)
+        sample = _describe_sample(args, size, seconds) if size >= SAMPLE_MIN_SIZE else None
+        with self._lock:
+            self.calls += 1
+            self.errors += failed
+            self.latency.observe(seconds)
+            self.sizes.observe(size)
+            if sample is not None:
+                self.samples.append(sample)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "llamadas": self.calls,
+                "errores": self.errors,
+                "latencia_s": self.latency.snapshot(),
+                "tamano_entrada": self.sizes.snapshot(),
+                "muestras": list(self.samples),
+            }
+
+def _describe_sample(args, size, seconds):
+    arrays = [np.asarray(arg) for arg in args if isinstance(arg, (np.ndarray, list, tuple))]
+    return {
+        "hora": time.time(),
+        "tamano": size,
+        "duracion_s": seconds,
+        "formas": [list(array.shape) for array in arrays],
+        "tipos": [str(array.dtype) for array in arrays],
+        "valores": [format_array(array) for array in arrays],
+    }
+
+class MetricsRegistry:
+    """Métricas de todas las funciones instrumentadas del proceso"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._functions = {}
+
+    def function_metrics(self, name):
+        metrics = self._functions.get(name)
+        if metrics is None:
+            metrics = self._functions[name] = FunctionMetrics(name)
+        return metrics
+
+    def reset(self):
+        for metrics in self._functions.values():
+            metrics.reset()
+
+    def snapshot(self):
+        return {name: metrics.snapshot() for name, metrics in self._functions.items()}
+
+    def to_json(self):
+        return json.dumps({"hora": time.time(), "funciones": self.snapshot()}, ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """Instantánea en el formato de exposición de texto de Prometheus"""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP vectores_llamadas_total Llamadas a cada función de cálculo",
+            "# TYPE vectores_llamadas_total counter",
+        ]
+        lines += [f'vectores_llamadas_total{{funcion="{name}"}} {data["llamadas"]}' for name, data in snapshot.items()]
+        lines += [
+            "# HELP vectores_errores_total Llamadas que terminaron con una excepción",
+            "# TYPE vectores_errores_total counter",
+        ]
+        lines += [f'vectores_errores_total{{funcion="{name}"}} {data["errores"]}' for name, data in snapshot.items()]
+
+        for metric, field, description in (
+            ("vectores_latencia_segundos", "latencia_s", "Duración de cada llamada"),
+            ("vectores_tamano_entrada_componentes", "tamano_entrada", "Componentes en los argumentos de cada llamada"),
+        ):
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} histogram"]
+            for name, data in snapshot.items():
+                histogram = data[field]
+                cumulative = 0
+                for bound, count in zip(list(histogram["limites"]) + ["+Inf"], histogram["cuentas"]):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{funcion="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{funcion="{name}"}} {histogram["suma"]}')
+                lines.append(f'{metric}_count{{funcion="{name}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+# Registro compartido por todo el proceso
+registry = MetricsRegistry(enabled=bool(os.environ.get(METRICS_ENV)))
+
+def enable(enabled=True):
+    registry.enabled = enabled
+
+def instrumented(function=None, *, name=None):
+    """Decorador que registra llamadas, latencia y tamaño de entrada de function
+
+    functools.wraps conserva __module__ y __qualname__, así que la función
+    decorada sigue pudiendo enviarse a otros procesos con pickle.
+    """
+    def decorate(function):
+        metrics = registry.function_metrics(name or function.__name__)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                metrics.observe(time.perf_counter() - start, args + tuple(kwargs.values()), failed)
+        return wrapper
+
+    if function is not None:
+        return decorate(function)
+    return decorate
+
+def write_snapshot(path):
+    """Escribe la instantánea en path: texto de Prometheus si termina en .prom, si no JSON"""
+    text = registry.to_prometheus() if path.endswith(".prom") else registry.to_json() + "\n"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
@@ -0,0 +1,226 @@
+"""Trazas de latencia por fase de los cálculos de las ventanas
+
+Se activan con la variable de entorno VECTORES_TRAZA (1, o la ruta de un .json
+donde volcarlas al cerrar) o desde el panel de diagnóstico, que se abre con
+Ctrl+Shift+D en cualquiera de las ventanas. Cada cálculo crea una Trace y va
+marcando el final de sus fases (análisis del texto, cola, cálculo, entrega al
+hilo de Tk, resultado, explicación, gráfico y dibujo); las trazas terminadas
+se guardan en un búfer circular de tamaño fijo.
+
+Desactivadas, begin devuelve NULL_TRACE, cuyas marcas no hacen nada.
+"""
+import collections
+import json
+import os
+import time
+
+TRACE_ENV = "VECTORES_TRAZA"
+DEFAULT_CAPACITY = 500
+REFRESH_MS = 1000
+
+class Trace:
+    """Tiempos de las fases consecutivas de un cálculo, en milisegundos"""
+
+    __slots__ = ('action', 'wall_time', 'started', 'phases', '_last')
+
+    def __init__(self, action):
+        self.action = action
+        self.wall_time = time.time()
+        self.started = self._last = time.perf_counter()
+        self.phases = {}
+
+    def mark(self, phase):
+        """Cierra la fase phase, que dura desde la marca anterior (o el inicio)"""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def record(self):
+        return {
+            "accion": self.action,
+            "hora": self.wall_time,
+            "total_ms": (self._last - self.started) * 1000,
+            "fases": dict(self.phases),
+        }
+
+class _NullTrace:
+    """Traza vacía que se usa con el registro desactivado"""
+
+    __slots__ = ()
+
+    def mark(self, phase):
+        pass
+
+NULL_TRACE = _NullTrace()
+
+class DrawTraceHook:
+    """Cierra una traza con la fase "dibujo" cuando el lienzo termina de dibujarse
+
+    draw_idle solo programa el dibujo, así que la traza queda a la espera del
+    draw_event de matplotlib; si llega otra antes, la anterior se guarda tal cual.
+    """
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.trace = NULL_TRACE
+
+    def connect(self, canvas):
+        canvas.mpl_connect('draw_event', self.on_draw)
+
+    def wait(self, trace):
+        self.tracer.finish(self.trace)
+        self.trace = trace
+
+    def on_draw(self, event):
+        trace, self.trace = self.trace, NULL_TRACE
+        trace.mark("dibujo")
+        self.tracer.finish(trace)
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(round((len(sorted_values) - 1) * fraction)))]
+
+class LatencyTracer:
+    """Búfer circular de las últimas trazas terminadas"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, enabled=False):
+        self.enabled = enabled
+        self._records = collections.deque(maxlen=capacity)
+
+    def begin(self, action):
+        """Empieza la traza de un cálculo (NULL_TRACE si el registro está desactivado)"""
+        return Trace(action) if self.enabled else NULL_TRACE
+
+    def finish(self, trace):
+        """Guarda una traza terminada; las NULL_TRACE se ignoran"""
+        if trace is not NULL_TRACE:
+            self._records.append(trace.record())
+
+    def records(self):
+        return list(self._records)
+
+    def clear(self):
+        self._records.clear()
+
+    def summary(self):
+        """Por acción y fase (incluido el total): número de trazas, p50, p90 y máximo en ms"""
+        samples = collections.defaultdict(list)
+        for record in self._records:
+            for phase, ms in record["fases"].items():
+                samples[record["accion"], phase].append(ms)
+            samples[record["accion"], "total"].append(record["total_ms"])
+
+        rows = []
+        for (action, phase), values in samples.items():
+            values.sort()
+            rows.append({
+                "accion": action,
+                "fase": phase,
+                "n": len(values),
+                "p50_ms": _percentile(values, 0.5),
+                "p90_ms": _percentile(values, 0.9),
+                "max_ms": values[-1],
+            })
+        return rows
+
+    def dump(self, path):
+        """Escribe el resumen y todas las trazas del búfer en un archivo JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"resumen": self.summary(), "trazas": self.records()}, f, ensure_ascii=False, indent=2)
+
+def _tracer_from_environment():
+    return LatencyTracer(enabled=bool(os.environ.get(TRACE_ENV)))
+
+# Registro compartido por todas las ventanas del proceso
+tracer = _tracer_from_environment()
+
+class DiagnosticsPanel:
+    """Ventana con el resumen de las trazas, que se refresca mientras está abierta"""
+
+    COLUMNS = (("accion", "Acción", 150), ("fase", "Fase", 110), ("n", "N", 50),
+               ("p50_ms", "p50 (ms)", 80), ("p90_ms", "p90 (ms)", 80), ("max_ms", "Máx (ms)", 80))
+
+    def __init__(self, root, tracer):
+        import tkinter as tk
+        from tkinter import ttk
+
+        self.tracer = tracer
+        self.window = tk.Toplevel(root)
+        self.window.title("Diagnóstico de latencia")
+        self.window.geometry("600x360")
+
+        controls = ttk.Frame(self.window)
+        controls.pack(fill=tk.X, padx=10, pady=(10, 5))
+        self.enabled = tk.BooleanVar(value=tracer.enabled)
+        ttk.Checkbutton(controls, text="Registrar trazas", variable=self.enabled,
+                        command=self.toggle).pack(side=tk.LEFT)
+        ttk.Button(controls, text="Guardar JSON…", command=self.save).pack(side=tk.RIGHT)
+        ttk.Button(controls, text="Limpiar", command=self.clear).pack(side=tk.RIGHT, padx=5)
+
+        self.table = ttk.Treeview(self.window, columns=[name for name, _, _ in self.COLUMNS], show='headings')
+        for name, heading, width in self.COLUMNS:
+            self.table.heading(name, text=heading)
+            self.table.column(name, width=width, anchor=tk.W if name in ("accion", "fase") else tk.E)
+        self.table.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+
+        self._refresh_id = None
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def refresh(self):
+        self.table.delete(*self.table.get_children())
+        for row in self.tracer.summary():
+            self.table.insert('', 'end', values=(
+                row["accion"], row["fase"], row["n"],
+                f"{row['p50_ms']:.2f}", f"{row['p90_ms']:.2f}", f"{row['max_ms']:.2f}"
+            ))
+        self._refresh_id = self.window.after(REFRESH_MS, self.refresh)
+
+    def toggle(self):
+        self.tracer.enabled = self.enabled.get()
+
+    def clear(self):
+        self.tracer.clear()
+
+    def save(self):
+        from tkinter import filedialog, messagebox
+
+        path = filedialog.asksaveasfilename(parent=self.window, defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")], initialfile="trazas.json")
+        if not path:
+            return
+        try:
+            self.tracer.dump(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudo guardar el archivo:\n{e}", parent=self.window)
+
+    def close(self):
+        if self._refresh_id is not None:
+            self.window.after_cancel(self._refresh_id)
+        self.window.destroy()
+
+def install_diagnostics(root, tracer=tracer):
+    """Enlaza Ctrl+Shift+D al panel de diagnóstico y, si se pidió, el volcado al cerrar
+
+    El atajo se enlaza a root y no a toda la aplicación: las ventanas abiertas
+    desde el lanzador comparten intérprete y cada una abre su propio panel.
+    """
+    panel = None
+
+    def open_panel(event=None):
+        nonlocal panel
+        if panel is not None and panel.window.winfo_exists():
+            panel.window.lift()
+        else:
+            panel = DiagnosticsPanel(root, tracer)
+
+    root.bind("<Control-Shift-D>", open_panel)
+
+    path = os.environ.get(TRACE_ENV, "")
+    if path.lower().endswith(".json"):
+        def dump_on_close(event):
+            if event.widget is root:
+                try:
+                    tracer.dump(path)
+                except OSError:
+                    pass
+        root.bind("<Destroy>", dump_on_close, add="+")
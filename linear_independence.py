@@ -1,8 +1,103 @@
 import numpy as np
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from tkinter import ttk, messagebox
+from background_worker import BackgroundWorker
+from latency_trace import NULL_TRACE, DrawTraceHook, install_diagnostics, tracer
+from linear_independence_console import IncrementalBasis, analyze_vector_set
+from result_cache import shared_cache, make_key
+from text_format import format_array
+from vector_parser import parse_vector, parse_vectors
+from virtual_list import VirtualList
+from window_style import WindowStyle
+
+SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+def space_name(dimension):
+    """Nombre del espacio ℝⁿ con el exponente en superíndice (p. ej. ℝ³)"""
+    return "ℝ" + str(dimension).translate(SUPERSCRIPTS)
+
+def format_vector(vector):
+    """Vector en una línea, resumido con puntos suspensivos si es muy largo"""
+    return format_array(vector, separator=', ')
+
+def determinant_explanation(matrix, det):
+    """Explicación del método del determinante para una matriz cuadrada de vectores columna"""
+    n = matrix.shape[0]
+    space = space_name(n)
+    parts = [
+        "📚 EXPLICACIÓN MATEMÁTICA\n\n",
+        f"Para {n} vectores en {space}, calculamos el determinante de la matriz {n}×{n} formada por estos vectores como columnas.\n\n",
+
+        "1️⃣ Construcción de la matriz:\n",
+        "La matriz se forma usando los vectores como columnas:\n",
+        format_array(matrix) + "\n\n",
+
+        f"2️⃣ Cálculo del determinante: det(A) = {det:.6f}\n\n",
+    ]
+
+    if np.isclose(det, 0, atol=1e-10):
+        parts.append("3️⃣ Interpretación (determinante = 0):\n")
+        if n == 3:
+            parts.append("   - Los vectores son coplanares (están en el mismo plano)\n")
+        else:
+            parts.append(f"   - Los vectores están en un subespacio de dimensión menor que {n}\n")
+        parts.append("   - Existe una relación lineal entre ellos\n")
+        parts.append("   - El sistema tiene infinitas soluciones\n")
+    else:
+        parts.append("3️⃣ Interpretación (determinante ≠ 0):\n")
+        parts.append("   - Los vectores son linealmente independientes\n")
+        parts.append(f"   - Generan todo el espacio {space}\n")
+        parts.append(f"   - Forman una base para {space}\n")
+
+    parts.append("\n🔍 Interpretación geométrica:\n")
+    parts.append("El valor absoluto del determinante representa el volumen del paralelepípedo formado por los vectores. ")
+    parts.append("Si el volumen es cero, los vectores no generan todo el espacio.")
+    return "".join(parts)
+
+def rank_explanation(matrix, rank):
+    """Explicación del método del rango para una matriz no cuadrada de vectores columna"""
+    dimension, count = matrix.shape
+    space = space_name(dimension)
+    parts = [
+        "📚 EXPLICACIÓN MATEMÁTICA\n\n",
+        f"Para {count} vectores en {space}, la matriz formada por estos vectores como columnas es de {dimension}×{count}. ",
+        "Al no ser cuadrada no tiene determinante, así que usamos su rango: el número máximo de columnas linealmente independientes.\n\n",
+
+        "1️⃣ Construcción de la matriz:\n",
+        "La matriz se forma usando los vectores como columnas:\n",
+        format_array(matrix) + "\n\n",
+
+        f"2️⃣ Cálculo del rango: rango(A) = {rank} (máximo posible {min(dimension, count)})\n\n",
+    ]
+
+    if rank == count:
+        parts.append("3️⃣ Interpretación (rango = número de vectores):\n")
+        parts.append("   - Los vectores son linealmente independientes\n")
+        parts.append(f"   - Generan un subespacio de dimensión {rank} dentro de {space}\n")
+    else:
+        parts.append("3️⃣ Interpretación (rango < número de vectores):\n")
+        parts.append("   - Los vectores son linealmente dependientes\n")
+        parts.append("   - Al menos uno es combinación lineal de los demás\n")
+        parts.append(f"   - Generan un subespacio de dimensión {rank} dentro de {space}\n")
+        if count > dimension:
+            parts.append(f"   - Con más vectores ({count}) que componentes ({dimension}) nunca pueden ser independientes\n")
+
+    parts.append("\n🔍 Interpretación geométrica:\n")
+    parts.append("El rango es la dimensión del espacio que generan los vectores. ")
+    parts.append("Son independientes solo si cada vector añade una dirección nueva, es decir, si el rango coincide con la cantidad de vectores.")
+    return "".join(parts)
+
+def analysis_explanation(matrix, rank, det):
+    """Determinante para matrices cuadradas y rango para las demás, como check_linear_independence"""
+    if matrix.shape[0] == matrix.shape[1]:
+        return determinant_explanation(matrix, det)
+    return rank_explanation(matrix, rank)
+
+# Vectores que se enumeran en el resultado del análisis
+MAX_LISTED_VECTORS = 10
+
+# Por encima de este número solo se dibujan las flechas de mayor norma (ver VectorScene)
+MAX_DRAWN_VECTORS = 200
 
 class VectorApp:
     def __init__(self, root):
@@ -11,8 +106,8 @@ class VectorApp:
         self.root.geometry("900x750")
         self.root.resizable(True, True)
         
-        # Configuración de estilo
-        self.style = ttk.Style()
+        # Configuración de estilo, propia de esta ventana (ver window_style)
+        self.style = WindowStyle(self.root)
         self.style.theme_use('clam')
         self.style.configure('TFrame', background='#f0f2f5')
         self.style.configure('TLabel', background='#f0f2f5', font=('Segoe UI', 10))
@@ -24,12 +119,32 @@ class VectorApp:
                       background=[('active', '#3498db'), ('disabled', '#bdc3c7')])
         
         
-        # Variables
-        self.vectors = []
+        # Variables: self.vectors y sus estados son vistas de búferes que crecen al doble
+        self.reset_vector_storage()
+        self.basis = IncrementalBasis()
         self.dark_mode = False
+
+        # Bloques en espera de pasar por la base en el worker: (bloque, traza, al_agregar)
+        self.pending_blocks = []
+
+        # Clave de caché del análisis mostrado actualmente
+        self.displayed_key = None
+
+        # Datos de la explicación aún no escrita (se escribe al abrir su pestaña)
+        self.pending_explanation = None
         
+        # Los cálculos se ejecutan fuera del hilo de Tk (ver background_worker)
+        self.worker = BackgroundWorker(self.root, on_busy=self.set_busy)
+        self.root.bind("<Destroy>", self.on_destroy, add="+")
+
+        # Trazas de latencia por fase (Ctrl+Shift+D abre el panel de diagnóstico)
+        self._trace = NULL_TRACE
+        self.draw_trace = DrawTraceHook(tracer)
+        install_diagnostics(self.root)
+
         # Widgets
         self.create_widgets()
+        self.style.apply(self.root)
     
     def create_widgets(self):
         # Frame principal con scroll
@@ -60,7 +175,7 @@ class VectorApp:
         
         ttk.Label(
             header_frame, 
-            text="🔍 Análisis Avanzado de Vectores en ℝ³",
+            text="🔍 Análisis Avanzado de Vectores en ℝⁿ",
             style='Title.TLabel'
         ).pack(side=tk.LEFT)
         
@@ -79,7 +194,7 @@ class VectorApp:
         # Contador de vectores
         self.counter_label = ttk.Label(
             input_panel,
-            text="Vectores ingresados: 0/3",
+            text="Vectores ingresados: 0",
             font=('Segoe UI', 10, 'bold'),
             foreground='#2c3e50'
         )
@@ -89,7 +204,7 @@ class VectorApp:
         entry_frame = ttk.Frame(input_panel)
         entry_frame.pack(fill=tk.X)
         
-        ttk.Label(entry_frame, text="Vector (x, y, z):").pack(side=tk.LEFT)
+        ttk.Label(entry_frame, text="Vector (x, y, z, ...):").pack(side=tk.LEFT)
         
         self.vector_entry = ttk.Entry(entry_frame, width=30)
         self.vector_entry.pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
@@ -106,6 +221,13 @@ class VectorApp:
             style='TButton'
         )
         self.add_button.pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            button_frame,
+            text="📋 Pegar Bloque",
+            command=self.paste_vectors,
+            style='TButton'
+        ).pack(side=tk.LEFT, padx=5)
         
         self.analyze_button = ttk.Button(
             button_frame,
@@ -122,19 +244,21 @@ class VectorApp:
             command=self.clear_vectors,
             style='TButton'
         ).pack(side=tk.LEFT, padx=5)
+
+        # Indicador de cálculo en curso: solo visible mientras trabaja el worker
+        self.busy_bar = ttk.Progressbar(button_frame, mode='indeterminate', length=100)
         
         # Visualización de vectores
         vector_display_frame = ttk.LabelFrame(scrollable_frame, text=" Vectores Ingresados ", padding=10)
         vector_display_frame.pack(fill=tk.BOTH, padx=10, pady=5, expand=True)
         
-        self.vector_display = scrolledtext.ScrolledText(
+        # Solo se dibujan las filas visibles, así que miles de vectores no cuestan más que unos pocos
+        self.vector_display = VirtualList(
             vector_display_frame,
-            width=60,
+            self.vector_row_text,
             height=5,
             font=('Consolas', 10),
-            wrap=tk.NONE,
-            bg='white',
-            relief=tk.FLAT
+            bg='white'
         )
         self.vector_display.pack(fill=tk.BOTH, expand=True)
         
@@ -142,12 +266,14 @@ class VectorApp:
         results_frame = ttk.LabelFrame(scrollable_frame, text=" Resultados del Análisis ", padding=10)
         results_frame.pack(fill=tk.BOTH, padx=10, pady=5, expand=True)
         
-        notebook = ttk.Notebook(results_frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = ttk.Notebook(results_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        # La explicación se construye solo cuando su pestaña está a la vista
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.update_explanation())
         
         # Pestaña de resultados
-        result_tab = ttk.Frame(notebook)
-        notebook.add(result_tab, text="📊 Resultados")
+        result_tab = ttk.Frame(self.notebook)
+        self.notebook.add(result_tab, text="📊 Resultados")
         
         self.result_text = tk.Text(
             result_tab,
@@ -163,11 +289,11 @@ class VectorApp:
         self.result_text.pack(fill=tk.BOTH, expand=True)
         
         # Pestaña de explicación
-        explanation_tab = ttk.Frame(notebook)
-        notebook.add(explanation_tab, text="📚 Explicación")
+        self.explanation_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.explanation_tab, text="📚 Explicación")
         
         self.explanation_text = tk.Text(
-            explanation_tab,
+            self.explanation_tab,
             width=60,
             height=8,
             font=('Segoe UI', 9),
@@ -178,60 +304,66 @@ class VectorApp:
             relief=tk.FLAT
         )
         self.explanation_text.pack(fill=tk.BOTH, expand=True)
-        self.explanation_text.insert(tk.END, "Ingrese exactamente 3 vectores para analizar...")
+        self.explanation_text.insert(tk.END, "Ingrese vectores para analizar...")
         self.explanation_text.config(state=tk.DISABLED)
         
-        # Gráfico 3D
-        graph_frame = ttk.LabelFrame(scrollable_frame, text=" Visualización 3D ", padding=10)
-        graph_frame.pack(fill=tk.BOTH, padx=10, pady=10, expand=True)
-        
+        # Gráfico 3D: la figura se crea al dibujar por primera vez (ver ensure_figure)
+        self.graph_frame = ttk.LabelFrame(scrollable_frame, text=" Visualización 3D ", padding=10)
+        self.graph_frame.pack(fill=tk.BOTH, padx=10, pady=10, expand=True)
+
+        self.figure = None
+        self.graph_placeholder = ttk.Label(
+            self.graph_frame,
+            text="Ingrese vectores de ℝ³\npara visualizar",
+            foreground='gray',
+            justify=tk.CENTER
+        )
+        self.graph_placeholder.pack(expand=True, pady=40)
+
+    def set_busy(self, busy):
+        """Muestra u oculta el indicador mientras el worker calcula"""
+        if busy:
+            self.busy_bar.pack(side=tk.LEFT, padx=5)
+            self.busy_bar.start(10)
+            self.root.config(cursor='watch')
+        else:
+            self.busy_bar.stop()
+            self.busy_bar.pack_forget()
+            self.root.config(cursor='')
+
+    def on_destroy(self, event):
+        if event.widget is self.root:
+            self.worker.shutdown()
+
+    def ensure_figure(self):
+        """Crea la figura en el primer dibujo; matplotlib solo se importa entonces"""
+        if self.figure is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from plot_scenes import VectorScene
+
+        self.graph_placeholder.destroy()
         self.figure = Figure(figsize=(6, 4), dpi=100, facecolor='#f0f2f5')
         self.ax = self.figure.add_subplot(111, projection='3d')
-        self.canvas = FigureCanvasTkAgg(self.figure, master=graph_frame)
+        self.scene = VectorScene(self.ax, max_arrows=MAX_DRAWN_VECTORS)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        self.draw_empty_plot()
+        self.draw_trace.connect(self.canvas)
+        self.apply_plot_theme()
     
-    def draw_empty_plot(self):
-        self.ax.clear()
-        self.ax.set_title("Visualización de Vectores 3D", pad=20)
-        self.ax.set_xlabel('Eje X')
-        self.ax.set_ylabel('Eje Y')
-        self.ax.set_zlabel('Eje Z')
-        self.ax.text(0, 0, 0, "Ingrese 3 vectores\npara visualizar", 
-                    ha='center', va='center', fontsize=10, color='gray')
-        self.canvas.draw()
+    def draw_empty_plot(self, message=None):
+        if self.figure is None:
+            # Aún no se ha dibujado nada: el texto de espera sigue visible
+            return
+        self.scene.show_empty(message)
+        self.canvas.draw_idle()
     
     def draw_vectors(self):
-        self.ax.clear()
-        
-        # Configuración de ejes
-        self.ax.set_title("Visualización de Vectores 3D", pad=20)
-        self.ax.set_xlabel('Eje X')
-        self.ax.set_ylabel('Eje Y')
-        self.ax.set_zlabel('Eje Z')
-        
-        # Origen
-        origin = [0, 0, 0]
-        
-        # Dibujar cada vector
-        colors = ['r', 'g', 'b']
-        labels = ['Vector 1', 'Vector 2', 'Vector 3']
-        
-        for i, (vector, color, label) in enumerate(zip(self.vectors, colors, labels)):
-            self.ax.quiver(*origin, *vector, color=color, arrow_length_ratio=0.1, label=label)
-            # Añadir etiqueta al final del vector
-            self.ax.text(*vector, f"v{i+1}", color=color)
-        
-        # Ajustar límites de los ejes
-        max_val = max(max(abs(val) for val in vector) for vector in self.vectors) + 1
-        self.ax.set_xlim([-max_val, max_val])
-        self.ax.set_ylim([-max_val, max_val])
-        self.ax.set_zlim([-max_val, max_val])
-        
-        # Leyenda
-        self.ax.legend()
-        
-        self.canvas.draw()
+        self.ensure_figure()
+        # Flechas y etiquetas se actualizan en su sitio (ver plot_scenes)
+        self.scene.update(self.vectors)
+        self.canvas.draw_idle()
     
     def toggle_dark_mode(self):
         self.dark_mode = not self.dark_mode
@@ -246,16 +378,9 @@ class VectorApp:
             self.style.configure('TLabel', background=bg_color, foreground=fg_color)
             self.style.configure('Title.TLabel', foreground='#3498db')
             self.root.configure(background=bg_color)
-            self.vector_display.configure(bg=entry_bg, fg=fg_color)
+            self.vector_display.set_colors(entry_bg, fg_color)
             self.result_text.configure(bg=entry_bg, fg=fg_color)
             self.explanation_text.configure(bg='#34495e', fg=fg_color)
-            self.figure.set_facecolor('#34495e')
-            self.ax.set_facecolor('#34495e')
-            self.ax.tick_params(colors=fg_color)
-            self.ax.xaxis.label.set_color(fg_color)
-            self.ax.yaxis.label.set_color(fg_color)
-            self.ax.zaxis.label.set_color(fg_color)
-            self.ax.title.set_color(fg_color)
         else:
             # Estilo claro
             bg_color = '#f0f2f5'
@@ -266,94 +391,229 @@ class VectorApp:
             self.style.configure('TLabel', background=bg_color, foreground=fg_color)
             self.style.configure('Title.TLabel', foreground='#2c3e50')
             self.root.configure(background=bg_color)
-            self.vector_display.configure(bg=entry_bg, fg='black')
+            self.vector_display.set_colors(entry_bg, 'black')
             self.result_text.configure(bg=entry_bg, fg='black')
             self.explanation_text.configure(bg='#f9f9f9', fg='black')
-            self.figure.set_facecolor('#f0f2f5')
-            self.ax.set_facecolor('#f0f2f5')
-            self.ax.tick_params(colors='black')
-            self.ax.xaxis.label.set_color('black')
-            self.ax.yaxis.label.set_color('black')
-            self.ax.zaxis.label.set_color('black')
-            self.ax.title.set_color('black')
-        
-        if len(self.vectors) == 3:
-            self.draw_vectors()
-        else:
-            self.draw_empty_plot()
+
+        # Los artistas se conservan: basta con cambiar sus colores
+        self.apply_plot_theme()
+        if self.figure is not None:
+            self.canvas.draw_idle()
     
-    def add_vector(self, event=None):
-        if len(self.vectors) >= 3:
-            messagebox.showwarning("Límite alcanzado", "Ya has ingresado 3 vectores (máximo permitido)")
+    def apply_plot_theme(self):
+        """Aplica a la figura los colores del modo actual, si ya existe"""
+        if self.figure is None:
             return
-            
+        if self.dark_mode:
+            face_color, fg_color = '#34495e', '#ecf0f1'
+        else:
+            face_color, fg_color = '#f0f2f5', 'black'
+        self.figure.set_facecolor(face_color)
+        self.ax.set_facecolor(face_color)
+        self.ax.tick_params(colors=fg_color)
+        self.ax.xaxis.label.set_color(fg_color)
+        self.ax.yaxis.label.set_color(fg_color)
+        self.ax.zaxis.label.set_color(fg_color)
+        self.ax.title.set_color(fg_color)
+        self.scene.set_text_color(fg_color)
+
+    def add_vector(self, event=None):
         vec_input = self.vector_entry.get().strip()
         if not vec_input:
             return
             
+        trace = tracer.begin("agregar vector")
         try:
-            # Validar que sean exactamente 3 componentes
-            components = [x.strip() for x in vec_input.split(",")]
-            if len(components) != 3:
-                raise ValueError("Debe ingresar exactamente 3 componentes (x, y, z)")
-                
-            vector = [float(x) for x in components]
-            self.vectors.append(vector)
-            self.vector_display.insert(tk.END, f"🔹 Vector {len(self.vectors)}: {vector}\n")
-            self.vector_entry.delete(0, tk.END)
-            
-            # Actualizar contador
-            self.counter_label.config(text=f"Vectores ingresados: {len(self.vectors)}/3")
-            
-            # Habilitar análisis cuando haya 3 vectores
-            if len(self.vectors) == 3:
-                self.analyze_button.config(state=tk.NORMAL)
-                self.vector_entry.config(state=tk.DISABLED, style='Disabled.TEntry')
-                self.add_button.config(state=tk.DISABLED)
-                self.explanation_text.config(state=tk.NORMAL)
-                self.explanation_text.delete(1.0, tk.END)
-                self.explanation_text.insert(tk.END, "Presione 'Analizar' para ver los resultados...")
-                self.explanation_text.config(state=tk.DISABLED)
-                self.draw_vectors()
-                
+            vector = parse_vector(vec_input)
+            trace.mark("analisis")
+            self.append_vectors(vector[np.newaxis], trace,
+                                on_added=lambda: self.vector_entry.delete(0, tk.END))
+        except ValueError as e:
+            messagebox.showerror("Error", f"Datos inválidos: {str(e)}\n\nEjemplo correcto: 1.5, 2.0, -3.2", parent=self.root)
+
+    def paste_vectors(self):
+        """Agrega de una vez los vectores del portapapeles, uno por línea"""
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            messagebox.showwarning("Portapapeles vacío", "Copie primero los vectores, uno por línea", parent=self.root)
+            return
+
+        trace = tracer.begin("pegar bloque")
+        try:
+            # Las hojas de cálculo copian las columnas separadas por tabuladores
+            block = parse_vectors(text, delimiter="\t" if "\t" in text else ",")
+            trace.mark("analisis")
+            self.append_vectors(block, trace)
         except ValueError as e:
-            messagebox.showerror("Error", f"Datos inválidos: {str(e)}\n\nEjemplo correcto: 1.5, 2.0, -3.2")
+            messagebox.showerror("Error", f"Datos inválidos: {str(e)}\n\nUn vector por línea, por ejemplo:\n1.5, 2.0, -3.2\n0.0, 1.0, 4.0", parent=self.root)
+
+    def append_vectors(self, block, trace=NULL_TRACE, on_added=None):
+        """Añade una pila (N, d) de vectores; la base se actualiza en el worker
+
+        Los bloques se procesan de uno en uno y en orden, y mientras quede alguno
+        pendiente no se puede analizar. on_added() se llama en el hilo de Tk
+        cuando el bloque ya forma parte de la lista.
+        """
+        self.pending_blocks.append((block, trace, on_added))
+        self.analyze_button.config(state=tk.DISABLED)
+        if len(self.pending_blocks) == 1:
+            self.submit_pending_block()
+
+    def submit_pending_block(self):
+        block, trace, _ = self.pending_blocks[0]
+        self.worker.submit(
+            self.basis.add_many, block,
+            on_success=self.show_added_vectors, on_error=self.show_add_error, trace=trace
+        )
+
+    def finish_pending_block(self):
+        """Quita el bloque terminado y envía el siguiente, o reactiva el análisis"""
+        self.pending_blocks.pop(0)
+        if self.pending_blocks:
+            self.submit_pending_block()
+        elif self.vector_count:
+            self.analyze_button.config(state=tk.NORMAL)
+
+    def show_add_error(self, e):
+        _, trace, _ = self.pending_blocks[0]
+        tracer.finish(trace)
+        self.finish_pending_block()
+        messagebox.showerror("Error", f"Datos inválidos: {str(e)}", parent=self.root)
+
+    def reset_vector_storage(self):
+        self.vector_count = 0
+        self._vector_buffer = np.empty((0, 0))
+        self._independent_buffer = np.zeros(0, dtype=bool)
+        self._residual_buffer = np.zeros(0)
+        self.vectors = self._vector_buffer
+        self.vector_independent = self._independent_buffer
+        self.vector_residuals = self._residual_buffer
+
+    def store_vectors(self, block, independent, residuals):
+        """Copia un bloque al final de los búferes; al llenarse duplican su capacidad"""
+        start, count = self.vector_count, self.vector_count + len(block)
+        if start == 0 or count > len(self._vector_buffer):
+            capacity = max(count, 2 * len(self._vector_buffer), 16)
+            vector_buffer = np.empty((capacity, block.shape[1]))
+            independent_buffer = np.zeros(capacity, dtype=bool)
+            residual_buffer = np.zeros(capacity)
+            if start:
+                vector_buffer[:start] = self._vector_buffer[:start]
+                independent_buffer[:start] = self._independent_buffer[:start]
+                residual_buffer[:start] = self._residual_buffer[:start]
+            self._vector_buffer = vector_buffer
+            self._independent_buffer = independent_buffer
+            self._residual_buffer = residual_buffer
+
+        self._vector_buffer[start:count] = block
+        self._independent_buffer[start:count] = independent
+        self._residual_buffer[start:count] = residuals
+        self.vector_count = count
+        self.vectors = self._vector_buffer[:count]
+        self.vector_independent = self._independent_buffer[:count]
+        self.vector_residuals = self._residual_buffer[:count]
+
+    def show_added_vectors(self, result):
+        """Guarda el bloque ya procesado por la base y actualiza lista, contador y gráfico"""
+        block, trace, on_added = self.pending_blocks[0]
+        independent, residuals = result
+        self.store_vectors(block, independent, residuals)
+        self.finish_pending_block()
+        if on_added is not None:
+            on_added()
+
+        self.vector_display.set_count(len(self.vectors), scroll_to_end=True)
+        self.counter_label.config(
+            text=f"Vectores ingresados: {len(self.vectors)} en {space_name(self.basis.dimension)} "
+                 f"(rango actual {self.basis.rank})"
+        )
+        self.pending_explanation = None
+        self.explanation_text.config(state=tk.NORMAL)
+        self.explanation_text.delete(1.0, tk.END)
+        self.explanation_text.insert(tk.END, "Presione 'Analizar' para ver los resultados...")
+        self.explanation_text.config(state=tk.DISABLED)
+        trace.mark("lista")
+
+        if self.basis.dimension == 3:
+            self.draw_vectors()
+        else:
+            self.draw_empty_plot(f"Solo se visualizan vectores de ℝ³\n(los actuales están en {space_name(self.basis.dimension)})")
+        trace.mark("grafico")
+        if self.figure is None:
+            tracer.finish(trace)
+        else:
+            self.draw_trace.wait(trace)
+
+    def vector_row_text(self, index):
+        """Texto de la fila index de la lista de vectores"""
+        if self.vector_independent[index]:
+            status = "independiente"
+        else:
+            status = f"dependiente, residuo {self.vector_residuals[index]:.2e}"
+        return f"🔹 Vector {index + 1}: {format_vector(self.vectors[index])}  ({status})"
     
     def analyze_vectors(self):
-        if len(self.vectors) != 3:
-            messagebox.showwarning("Error", "Debe ingresar exactamente 3 vectores")
+        if self.pending_blocks:
+            return
+        if len(self.vectors) == 0:
+            messagebox.showwarning("Error", "Debe ingresar al menos un vector", parent=self.root)
             return
             
+        # El rango, el determinante y la explicación se calculan en el worker
+        self._trace = tracer.begin("analizar")
+        self.worker.submit(
+            self.compute_analysis, self.vectors,
+            on_success=self.show_analysis, on_error=self.show_error, trace=self._trace
+        )
+
+    def compute_analysis(self, vectors):
+        """Calcula rango y determinante; se ejecuta fuera del hilo de Tk"""
+        matrix = vectors.T
+        key = make_key("independencia", matrix)
+        cached = shared_cache.get(key)
+        if cached is None:
+            cached = analyze_vector_set(vectors)
+            shared_cache.put(key, cached)
+        return key, matrix, cached
+
+    def show_analysis(self, result):
+        trace, self._trace = self._trace, NULL_TRACE
+        key, matrix, (independent, rank, det) = result
+        # Si ya se muestra el análisis de esta misma matriz no hay nada que actualizar
+        if key == self.displayed_key:
+            tracer.finish(trace)
+            return
+
         try:
+            dimension, count = matrix.shape
             self.result_text.config(state=tk.NORMAL)
             self.result_text.delete(1.0, tk.END)
-            self.explanation_text.config(state=tk.NORMAL)
-            self.explanation_text.delete(1.0, tk.END)
-            
-            matrix = np.array(self.vectors).T
-            
+
             # Encabezado del resultado
             self.result_text.insert(tk.END, "=== ANÁLISIS DE INDEPENDENCIA LINEAL ===\n\n", 'header')
-            self.result_text.insert(tk.END, "🔹 Vectores ingresados:\n", 'subheader')
-            for i, vec in enumerate(self.vectors, 1):
-                self.result_text.insert(tk.END, f"   Vector {i}: {vec}\n")
+            self.result_text.insert(tk.END, f"🔹 Vectores ingresados ({count} en {space_name(dimension)}):\n", 'subheader')
+            for i, vec in enumerate(matrix.T[:MAX_LISTED_VECTORS], 1):
+                self.result_text.insert(tk.END, f"   Vector {i}: {format_vector(vec)}\n")
+            if count > MAX_LISTED_VECTORS:
+                self.result_text.insert(tk.END, f"   ... y {count - MAX_LISTED_VECTORS} vectores más\n")
             self.result_text.insert(tk.END, "\n")
             
-            # Método del determinante (siempre para 3 vectores en ℝ³)
-            det = np.linalg.det(matrix)
-            self.result_text.insert(tk.END, "🔹 Método utilizado: Determinante\n", 'subheader')
-            self.result_text.insert(tk.END, f"   Valor del determinante: {det:.6f}\n\n")
-            
-            if not np.isclose(det, 0, atol=1e-10):
+            if dimension == count:
+                self.result_text.insert(tk.END, "🔹 Método utilizado: Determinante\n", 'subheader')
+                self.result_text.insert(tk.END, f"   Valor del determinante: {det:.6f}\n\n")
+            else:
+                self.result_text.insert(tk.END, "🔹 Método utilizado: Rango\n", 'subheader')
+                self.result_text.insert(tk.END, f"   Rango de la matriz: {rank} (con {count} vectores)\n\n")
+
+            if independent:
                 self.result_text.insert(tk.END, "✅ CONCLUSIÓN: Los vectores son LINEALMENTE INDEPENDIENTES\n\n", 'success')
-                explanation = self.get_determinant_explanation(matrix, det)
             else:
                 self.result_text.insert(tk.END, "❌ CONCLUSIÓN: Los vectores son LINEALMENTE DEPENDIENTES\n\n", 'error')
-                explanation = self.get_determinant_explanation(matrix, det)
-            
-            # Mostrar matriz
+
+            # Mostrar matriz (resumida si es grande)
             self.result_text.insert(tk.END, "🔹 Matriz de vectores (como columnas):\n", 'subheader')
-            self.result_text.insert(tk.END, str(matrix) + "\n")
+            self.result_text.insert(tk.END, format_array(matrix) + "\n")
             
             # Configurar estilos de texto
             self.result_text.tag_config('header', font=('Segoe UI', 11, 'bold'))
@@ -361,54 +621,51 @@ class VectorApp:
             self.result_text.tag_config('success', foreground='#27ae60', font=('Segoe UI', 10, 'bold'))
             self.result_text.tag_config('error', foreground='#e74c3c', font=('Segoe UI', 10, 'bold'))
             self.result_text.config(state=tk.DISABLED)
+            trace.mark("resultado")
             
-            # Mostrar explicación
-            self.explanation_text.insert(tk.END, explanation)
-            self.explanation_text.config(state=tk.DISABLED)
-            
+            # Explicación: se construye al mostrar su pestaña
+            self.pending_explanation = (matrix, rank, det)
+            self.update_explanation()
+            trace.mark("explicacion")
+            tracer.finish(trace)
+            self.displayed_key = key
+
         except Exception as e:
-            messagebox.showerror("Error", f"Error en el análisis:\n{str(e)}")
-    
-    def get_determinant_explanation(self, matrix, det):
-        explanation = "📚 EXPLICACIÓN MATEMÁTICA\n\n"
-        explanation += "Para tres vectores en el espacio tridimensional, calculamos el determinante de la matriz 3×3 formada por estos vectores como columnas.\n\n"
-        
-        explanation += "1️⃣ Construcción de la matriz:\n"
-        explanation += "La matriz se forma usando los vectores como columnas:\n"
-        explanation += str(matrix) + "\n\n"
-        
-        explanation += f"2️⃣ Cálculo del determinante: det(A) = {det:.6f}\n\n"
-        
-        if np.isclose(det, 0, atol=1e-10):
-            explanation += "3️⃣ Interpretación (determinante = 0):\n"
-            explanation += "   - Los vectores son coplanares (están en el mismo plano)\n"
-            explanation += "   - Existe una relación lineal entre ellos\n"
-            explanation += "   - El sistema tiene infinitas soluciones\n"
-        else:
-            explanation += "3️⃣ Interpretación (determinante ≠ 0):\n"
-            explanation += "   - Los vectores son linealmente independientes\n"
-            explanation += "   - Generan todo el espacio tridimensional\n"
-            explanation += "   - Forman una base para ℝ³\n"
-        
-        explanation += "\n🔍 Interpretación geométrica:\n"
-        explanation += "El valor absoluto del determinante representa el volumen del paralelepípedo formado por los tres vectores. "
-        explanation += "Si el volumen es cero, los vectores están en el mismo plano."
-        
-        return explanation
+            self.show_error(e)
+
+    def update_explanation(self):
+        """Escribe la explicación pendiente si su pestaña está visible"""
+        if self.pending_explanation is None or self.notebook.select() != str(self.explanation_tab):
+            return
+        explanation = analysis_explanation(*self.pending_explanation)
+        self.pending_explanation = None
+
+        self.explanation_text.config(state=tk.NORMAL)
+        self.explanation_text.delete(1.0, tk.END)
+        self.explanation_text.insert(tk.END, explanation)
+        self.explanation_text.config(state=tk.DISABLED)
+
+    def show_error(self, e):
+        self._trace = NULL_TRACE
+        messagebox.showerror("Error", f"Error en el análisis:\n{str(e)}", parent=self.root)
     
     def clear_vectors(self):
-        self.vectors = []
-        self.vector_display.delete(1.0, tk.END)
+        # Descartar un análisis que aún esté en curso
+        self.worker.cancel()
+        self.pending_blocks.clear()
+        self.reset_vector_storage()
+        self.basis = IncrementalBasis()
+        self.displayed_key = None
+        self.pending_explanation = None
+        self.vector_display.set_count(0)
         self.result_text.config(state=tk.NORMAL)
         self.result_text.delete(1.0, tk.END)
         self.result_text.config(state=tk.DISABLED)
         self.explanation_text.config(state=tk.NORMAL)
         self.explanation_text.delete(1.0, tk.END)
-        self.explanation_text.insert(tk.END, "Ingrese exactamente 3 vectores para analizar...")
+        self.explanation_text.insert(tk.END, "Ingrese vectores para analizar...")
         self.explanation_text.config(state=tk.DISABLED)
-        self.counter_label.config(text="Vectores ingresados: 0/3")
-        self.vector_entry.config(state=tk.NORMAL)
-        self.add_button.config(state=tk.NORMAL)
+        self.counter_label.config(text="Vectores ingresados: 0")
         self.analyze_button.config(state=tk.DISABLED)
         self.vector_entry.delete(0, tk.END)
         self.draw_empty_plot()
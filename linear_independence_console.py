@@ -1,5 +1,13 @@
+import argparse
+import functools
 import numpy as np
+from batch_io import add_batch_arguments, run_batch
+from instrumentation import enable as enable_metrics, instrumented, write_snapshot
+from text_format import format_array
+from vec3 import Vec3, small_components
+from vector_parser import parse_vector
 
+@instrumented
 def check_linear_independence(vectors):
     """Determina si los vectores son linealmente independientes"""
     # Convertir a matriz numpy (cada vector como columna)
@@ -20,7 +28,192 @@ def check_linear_independence(vectors):
         else:
             return False, f"El rango de la matriz es {rank} (no máximo)"
 
-def main():
+def _determinant_3x3(matrices):
+    """Determinante en forma cerrada de una pila (N, 3, 3) de matrices"""
+    m = matrices
+    return (m[:, 0, 0] * (m[:, 1, 1] * m[:, 2, 2] - m[:, 1, 2] * m[:, 2, 1])
+            - m[:, 0, 1] * (m[:, 1, 0] * m[:, 2, 2] - m[:, 1, 2] * m[:, 2, 0])
+            + m[:, 0, 2] * (m[:, 1, 0] * m[:, 2, 1] - m[:, 1, 1] * m[:, 2, 0]))
+
+def _small_determinant(vectors):
+    """Determinante de tres vectores de ℝ³ en Python puro, o None si no aplica
+
+    Usa la misma expresión que _determinant_3x3, así que coincide con el
+    análisis en lote.
+    """
+    if len(vectors) != 3:
+        return None
+    componentes = [small_components(v, 3) for v in vectors]
+    if not all(comp is not None and len(comp) == 3 for comp in componentes):
+        return None
+    u, v, w = (Vec3.from_components(comp) for comp in componentes)
+    return np.float64(Vec3.det3(u, v, w))
+
+@instrumented
+def analyze_vector_set(vectors):
+    """Analiza un único conjunto (k, d) y devuelve (independiente, rango, determinante)
+
+    Equivale a check_linear_independence_batch con un solo conjunto. Como allí,
+    un conjunto cuadrado con |det| > 1e-10 se da por independiente con rango k
+    aunque matrix_rank pudiera ver un rango numérico menor (p. ej. en
+    diag(1e6, 1e6, 1e-21)). Para tres vectores de ℝ³ ese caso se resuelve sin
+    pasar por NumPy.
+    """
+    det = _small_determinant(vectors)
+    # abs(det) <= 1e-10 equivale a np.isclose(det, 0, atol=1e-10) sin su coste
+    if det is not None and not abs(det) <= 1e-10:
+        return True, 3, det
+    # Sin el decorador: la llamada ya se cuenta en analyze_vector_set
+    batch = check_linear_independence_batch.__wrapped__
+    independent, ranks, dets = batch(np.asarray(vectors, dtype=float)[np.newaxis])
+    return bool(independent[0]), int(ranks[0]), dets[0]
+
+@instrumented
+def check_linear_independence_batch(vector_sets):
+    """Analiza en lote una pila (N, k, d) de conjuntos de k vectores en ℝ^d
+
+    Devuelve, por conjunto, la bandera de independencia, el rango y el
+    determinante (NaN si k != d). Igual que check_linear_independence, los
+    conjuntos cuadrados se deciden por el determinante y el resto por el rango.
+    En los cuadrados con determinante no nulo el rango es k, así que la SVD de
+    matrix_rank solo se calcula para los que tienen determinante casi nulo.
+    """
+    vector_sets = np.asarray(vector_sets, dtype=float)
+    if vector_sets.ndim != 3:
+        raise ValueError("Los conjuntos de vectores deben tener forma (N, k, d)")
+    n_sets, k, d = vector_sets.shape
+
+    # Cada vector como columna, igual que en check_linear_independence
+    matrices = vector_sets.transpose(0, 2, 1)
+
+    if k == d:
+        if k == 3:
+            dets = _determinant_3x3(matrices)
+        else:
+            dets = np.linalg.det(matrices)
+        independent = ~np.isclose(dets, 0, atol=1e-10)
+        ranks = np.full(n_sets, k, dtype=int)
+        singular = ~independent
+        if singular.any():
+            ranks[singular] = np.linalg.matrix_rank(matrices[singular])
+    else:
+        ranks = np.linalg.matrix_rank(matrices) if n_sets else np.zeros(0, dtype=int)
+        dets = np.full(n_sets, np.nan)
+        independent = ranks == k
+    return independent, ranks, dets
+
+class IncrementalBasis:
+    """Base ortonormal que crece vector a vector para seguir el rango sin recalcularlo
+
+    Cada vector nuevo se ortogonaliza contra la base actual con Gram-Schmidt
+    aplicado dos veces (reortogonalización), con coste O(d·k). Si el residuo
+    es despreciable frente a la norma del vector, el vector es dependiente.
+    """
+
+    def __init__(self, tol=1e-10):
+        self.tol = tol
+        self.dimension = None
+        self.rank = 0
+        self.count = 0
+        self._basis = None
+
+    def add(self, vector):
+        """Añade un vector y devuelve (es_independiente, norma_del_residuo)"""
+        v = np.asarray(vector, dtype=float).ravel()
+        if self.dimension is None:
+            self.dimension = v.size
+            self._basis = np.empty((min(v.size, 8), v.size))
+        elif v.size != self.dimension:
+            raise ValueError(f"El vector tiene {v.size} componentes y se esperaban {self.dimension}")
+
+        residual = v.copy()
+        basis = self._basis[:self.rank]
+        for _ in range(2):
+            residual -= basis.T @ (basis @ residual)
+        residual_norm = float(np.linalg.norm(residual))
+        self.count += 1
+
+        independent = residual_norm > self.tol * max(float(np.linalg.norm(v)), 1.0)
+        if independent:
+            if self.rank == self._basis.shape[0]:
+                # Crecimiento geométrico de la capacidad, sin pasar de la dimensión
+                grown = np.empty((min(2 * self.rank, self.dimension), self.dimension))
+                grown[:self.rank] = self._basis[:self.rank]
+                self._basis = grown
+            self._basis[self.rank] = residual / residual_norm
+            self.rank += 1
+        return independent, residual_norm
+
+    def add_many(self, vectors):
+        """Añade una pila (N, d) y devuelve, por vector, (es_independiente, norma_del_residuo)
+
+        Mientras la base no cubre todo el espacio los vectores se añaden uno a
+        uno; en cuanto el rango llega a la dimensión el resto es necesariamente
+        dependiente y sus residuos se calculan de una sola vez.
+        """
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=float))
+        if self.dimension is not None and vectors.shape[1] != self.dimension:
+            raise ValueError(f"Los vectores tienen {vectors.shape[1]} componentes y se esperaban {self.dimension}")
+        n = len(vectors)
+        independent = np.zeros(n, dtype=bool)
+        residual_norms = np.zeros(n)
+
+        i = 0
+        while i < n and (self.dimension is None or self.rank < self.dimension):
+            independent[i], residual_norms[i] = self.add(vectors[i])
+            i += 1
+
+        if i < n:
+            basis = self._basis[:self.rank]
+            residuals = vectors[i:].copy()
+            for _ in range(2):
+                residuals -= (residuals @ basis.T) @ basis
+            residual_norms[i:] = np.linalg.norm(residuals, axis=1)
+            self.count += n - i
+        return independent, residual_norms
+
+    @property
+    def independent(self):
+        """True si todos los vectores añadidos hasta ahora son independientes"""
+        return self.rank == self.count
+
+def process_chunk(chunk, n_vectors):
+    """Procesa un bloque cuyas filas contienen n_vectors vectores concatenados
+
+    Cada fila de salida contiene la bandera de independencia (1/0), el rango y
+    el determinante (NaN si la matriz no es cuadrada).
+    """
+    if chunk.shape[1] % n_vectors != 0:
+        raise ValueError(f"El número de columnas ({chunk.shape[1]}) no es múltiplo de {n_vectors} vectores")
+    vector_sets = chunk.reshape(chunk.shape[0], n_vectors, chunk.shape[1] // n_vectors)
+    independent, ranks, dets = check_linear_independence_batch(vector_sets)
+    return np.column_stack([independent, ranks, dets])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Análisis de independencia lineal de vectores",
+        epilog="En modo por lotes cada fila contiene los vectores del conjunto concatenados."
+    )
+    add_batch_arguments(parser)
+    parser.add_argument(
+        "--vectores", metavar="K", type=int, default=3,
+        help="número de vectores por fila en modo por lotes (por defecto 3)"
+    )
+    args = parser.parse_args(argv)
+    if args.lote:
+        if args.vectores < 1:
+            raise SystemExit("Error: --vectores debe ser al menos 1")
+        if args.metricas:
+            enable_metrics()
+        try:
+            run_batch(functools.partial(process_chunk, n_vectors=args.vectores),
+                      args.lote, args.salida, args.tamano_bloque)
+            if args.metricas:
+                write_snapshot(args.metricas)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Error: {e}")
+        return
+
     print("=== Análisis de Independencia Lineal de Vectores ===")
     print("Instrucciones:")
     print("1. Ingrese cada vector separando sus componentes por comas")
@@ -29,26 +222,39 @@ def main():
     print("4. Escriba 'fin' para terminar la entrada\n")
     
     vectors = []
+    basis = IncrementalBasis()
     while True:
         entrada = input(f"Ingrese el vector {len(vectors)+1} (o 'fin' para terminar): ").strip()
-        
+
         if entrada.lower() == 'fin':
             break
-            
+
         try:
-            componentes = [float(x.strip()) for x in entrada.split(",")]
-            vectors.append(componentes)
-            print(f"Vector {len(vectors)} añadido: {componentes}")
-        except ValueError:
-            print("Error: Ingrese números válidos separados por comas. Ejemplo: 1, 2, 3")
-    
+            componentes = parse_vector(entrada).tolist()
+        except ValueError as e:
+            print(f"Error: {e}. Ingrese números válidos separados por comas. Ejemplo: 1, 2, 3")
+            continue
+
+        try:
+            es_independiente, residuo = basis.add(componentes)
+        except ValueError as e:
+            print(f"Error: {e}")
+            continue
+
+        vectors.append(componentes)
+        print(f"Vector {len(vectors)} añadido: {format_array(componentes, separator=', ')}")
+        if es_independiente:
+            print(f"   ↳ Independiente de los anteriores (residuo: {residuo:.6f}, rango actual: {basis.rank})")
+        else:
+            print(f"   ↳ Dependiente de los anteriores (residuo: {residuo:.6e}, rango actual: {basis.rank})")
+
     if not vectors:
         print("\nNo se ingresaron vectores. Saliendo...")
         return
     
     print("\n=== Vectores ingresados ===")
     for i, vec in enumerate(vectors, 1):
-        print(f"Vector {i}: {vec}")
+        print(f"Vector {i}: {format_array(vec, separator=', ')}")
     
     print("\n=== Resultado del análisis ===")
     es_independiente, explicacion = check_linear_independence(vectors)
@@ -62,7 +268,7 @@ def main():
     
     # Mostrar matriz formada por los vectores
     print("\nMatriz formada por los vectores (como columnas):")
-    print(np.array(vectors).T)
+    print(format_array(np.array(vectors).T))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
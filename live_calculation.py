@@ -0,0 +1,147 @@
+"""Cálculo en vivo a partir de los campos de texto de una ventana
+
+La proyección y el volumen comparten el mismo flujo: cada pulsación
+reprograma el recálculo tras LIVE_DELAY_MS sin escribir, los campos cuyo texto
+no cambió no se vuelven a analizar y al worker solo se envían las entradas que
+no se muestran ya ni están en curso. Los errores del modo en vivo van a la
+línea de estado, sin ventanas emergentes mientras se escribe; los del botón
+Calcular, a show_error.
+"""
+from latency_trace import NULL_TRACE, tracer
+from result_cache import make_key
+from vector_parser import parse_vector
+
+# Espera sin pulsaciones antes de recalcular en el modo en vivo
+LIVE_DELAY_MS = 25
+
+class LiveCalculation:
+    """Envía al worker el cálculo de los campos de una ventana, en vivo o al pulsar Calcular
+
+    fields son las StringVar de los vectores y live_mode la BooleanVar del
+    modo en vivo; operation da nombre a la clave de caché y a las trazas.
+    compute(clave, *vectores) se ejecuta en el worker y devuelve una tupla que
+    empieza por la clave. show_result(resultado, traza), show_error(excepción)
+    y show_status(texto) se llaman en el hilo de Tk.
+    """
+
+    def __init__(self, root, worker, fields, live_mode, operation, compute,
+                 show_result, show_error, show_status):
+        self.root = root
+        self.worker = worker
+        self.fields = fields
+        self.live_mode = live_mode
+        self.operation = operation
+        self.compute = compute
+        self.show_result = show_result
+        self.show_error = show_error
+        self.show_status = show_status
+
+        # Clave de caché de los vectores mostrados actualmente
+        self.displayed_key = None
+        self._live_id = None
+        self._pending_key = None
+        # Si el cálculo pendiente es de la vista previa (sus errores van a la línea de estado)
+        self._pending_live = False
+        self._trace = NULL_TRACE
+        self._parsed = {}
+        for field in fields:
+            field.trace_add("write", self.on_input_changed)
+
+    def parse_field(self, index, text):
+        """Analiza un campo reutilizando el resultado anterior si su texto no cambió"""
+        previous = self._parsed.get(index)
+        if previous is None or previous[0] != text:
+            try:
+                previous = (text, parse_vector(text), None)
+            except ValueError as e:
+                previous = (text, None, str(e))
+            self._parsed[index] = previous
+        _, vector, error = previous
+        if error is not None:
+            raise ValueError(error)
+        return vector
+
+    def on_input_changed(self, *args):
+        """Reprograma el recálculo en vivo con cada pulsación"""
+        if self._live_id is not None:
+            self.root.after_cancel(self._live_id)
+            self._live_id = None
+        if self.live_mode.get():
+            self._live_id = self.root.after(LIVE_DELAY_MS, self.live_update)
+
+    def live_update(self):
+        self._live_id = None
+        texts = [field.get() for field in self.fields]
+        if not all(text.strip() for text in texts):
+            # Campos a medio llenar: se mantiene el último resultado
+            self.show_status("")
+            return
+        trace = tracer.begin(f"{self.operation} en vivo")
+        try:
+            vectors = [self.parse_field(i, text) for i, text in enumerate(texts)]
+        except ValueError as e:
+            self.show_status(f"⚠️ {e}")
+            return
+        trace.mark("analisis")
+        self.submit(vectors, live=True, trace=trace)
+
+    def calculate(self):
+        """Calcula con los campos actuales (botón Calcular)"""
+        trace = tracer.begin(self.operation)
+        try:
+            vectors = [self.parse_field(i, field.get()) for i, field in enumerate(self.fields)]
+        except ValueError as e:
+            self._show_error(e)
+            return
+        trace.mark("analisis")
+        self.submit(vectors, trace=trace)
+
+    def submit(self, vectors, live=False, trace=NULL_TRACE):
+        """Envía el cálculo al worker salvo que esos vectores ya se muestren o estén en curso"""
+        key = make_key(self.operation, *vectors)
+        if key == self._pending_key and (live or not self._pending_live):
+            # Salvo que sea Calcular sobre una vista previa pendiente, que se reenvía
+            # para que sus errores se muestren con show_error
+            return
+        if key == self.displayed_key:
+            # Se volvió a lo que ya se muestra: el cálculo pendiente sobra
+            self.worker.cancel()
+            self._pending_key = None
+            self.show_status("")
+            return
+        self._pending_key = key
+        self._pending_live = live
+        self._trace = trace
+        self.worker.submit(
+            self.compute, key, *vectors,
+            on_success=self._show_result, on_error=self._show_live_error if live else self._show_error,
+            trace=trace
+        )
+
+    def cancel(self):
+        """Descarta el cálculo en curso y limpia la línea de estado"""
+        self.worker.cancel()
+        self._pending_key = None
+        self.show_status("")
+
+    def _show_result(self, result):
+        self._pending_key = None
+        self.show_status("")
+        trace, self._trace = self._trace, NULL_TRACE
+        key = result[0]
+        # Si ya se muestran estos mismos vectores no hay nada que actualizar
+        if key == self.displayed_key:
+            tracer.finish(trace)
+            return
+        self.show_result(result, trace)
+        self.displayed_key = key
+
+    def _show_live_error(self, e):
+        self._pending_key = None
+        self._trace = NULL_TRACE
+        self.show_status(f"⚠️ {e}")
+
+    def _show_error(self, e):
+        self._pending_key = None
+        self._trace = NULL_TRACE
+        self.show_error(e)
@@ -1,9 +1,40 @@
-import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from mpl_toolkits.mplot3d import Axes3D  # Para gráficos 3D
+from background_worker import BackgroundWorker
+from latency_trace import DrawTraceHook, install_diagnostics, tracer
+from live_calculation import LiveCalculation
+from orthogonal_projection_console import calcular_proyeccion
+from result_cache import shared_cache
+from text_format import format_array
+from window_style import WindowStyle
+
+def generate_explanation(a, b, dot_product, b_norm_squared, projection):
+    """Explicación paso a paso de la proyección; los vectores largos se muestran resumidos"""
+    a_text, b_text = format_array(a), format_array(b)
+    scalar = dot_product / b_norm_squared
+    parts = [
+        "📐 EXPLICACIÓN MATEMÁTICA DE LA PROYECCIÓN\n\n",
+        "Fórmula: proj_b a = (a·b / b·b) * b\n\n",
+
+        "1️⃣ Producto punto (a·b):\n",
+        f"   {a_text} · {b_text} = {dot_product:.6f}\n\n",
+
+        "2️⃣ Norma al cuadrado de b (b·b):\n",
+        f"   {b_text} · {b_text} = {b_norm_squared:.6f}\n\n",
+
+        "3️⃣ Factor escalar (a·b / b·b):\n",
+        f"   {dot_product:.6f} / {b_norm_squared:.6f} = {scalar:.6f}\n\n",
+
+        "4️⃣ Proyección resultante:\n",
+        f"   {scalar:.6f} * {b_text} = {format_array(projection, precision=6)}\n\n",
+
+        "🔍 Interpretación geométrica:\n",
+        "La proyección ortogonal representa la 'sombra' del vector a sobre el vector b.\n",
+        "- Si los vectores son ortogonales (a·b = 0), la proyección será el vector cero.\n",
+        "- Si los vectores son paralelos, la proyección será el mismo vector a.\n",
+        "- La diferencia a - proj_b a es ortogonal al vector b.",
+    ]
+    return "".join(parts)
 
 class VectorProjectionApp:
     def __init__(self, root):
@@ -12,8 +43,8 @@ class VectorProjectionApp:
         self.root.geometry("900x750")
         self.root.resizable(True, True)
         
-        # Configuración de estilo
-        self.style = ttk.Style()
+        # Configuración de estilo, propia de esta ventana (ver window_style)
+        self.style = WindowStyle(self.root)
         self.style.theme_use('clam')
         self.style.configure('TFrame', background='#f0f2f5')
         self.style.configure('TLabel', background='#f0f2f5', font=('Segoe UI', 10))
@@ -25,9 +56,30 @@ class VectorProjectionApp:
         # Variables para los vectores
         self.vector_a = tk.StringVar()
         self.vector_b = tk.StringVar()
-        
+
+        # Datos de la explicación aún no escrita (se escribe al abrir su pestaña)
+        self.pending_explanation = None
+
+        # Modo en vivo: se recalcula al escribir, tras una breve espera sin pulsaciones
+        self.live_mode = tk.BooleanVar(value=True)
+
+        # Los cálculos se ejecutan fuera del hilo de Tk (ver background_worker)
+        self.worker = BackgroundWorker(self.root, on_busy=self.set_busy)
+        self.root.bind("<Destroy>", self.on_destroy, add="+")
+
+        # Trazas de latencia por fase (Ctrl+Shift+D abre el panel de diagnóstico)
+        self.draw_trace = DrawTraceHook(tracer)
+        install_diagnostics(self.root)
+
+        # Análisis de los campos y envío al worker, en vivo o con el botón (ver live_calculation)
+        self.live = LiveCalculation(
+            self.root, self.worker, (self.vector_a, self.vector_b), self.live_mode, "proyeccion",
+            self.compute_projection, self.show_projection, self.show_error, self.show_status
+        )
+
         # Widgets
         self.create_widgets()
+        self.style.apply(self.root)
     
     def create_widgets(self):
         # Frame principal
@@ -63,7 +115,7 @@ class VectorProjectionApp:
         ttk.Button(
             button_frame,
             text="📐 Calcular Proyección",
-            command=self.calculate_projection,
+            command=self.live.calculate,
             style='TButton'
         ).pack(side=tk.LEFT, padx=5)
         
@@ -74,17 +126,34 @@ class VectorProjectionApp:
             command=self.clear_fields,
             style='TButton'
         ).pack(side=tk.LEFT, padx=5)
+
+        # Casilla del modo en vivo
+        ttk.Checkbutton(
+            button_frame,
+            text="⚡ Cálculo en vivo",
+            variable=self.live_mode,
+            command=self.live.on_input_changed
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Indicador de cálculo en curso: solo visible mientras trabaja el worker
+        self.busy_bar = ttk.Progressbar(button_frame, mode='indeterminate', length=100)
+
+        # Errores del modo en vivo (sin ventanas emergentes mientras se escribe)
+        self.status_label = ttk.Label(input_panel, text="", foreground='#e74c3c')
+        self.status_label.grid(row=3, column=0, columnspan=2, sticky=tk.W)
         
         # Resultados
         results_frame = ttk.LabelFrame(main_frame, text=" Resultados ", padding=10)
         results_frame.pack(fill=tk.BOTH, pady=5, expand=True)
         
-        notebook = ttk.Notebook(results_frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = ttk.Notebook(results_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        # La explicación se construye solo cuando su pestaña está a la vista
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.update_explanation())
         
         # Pestaña de resultados
-        result_tab = ttk.Frame(notebook)
-        notebook.add(result_tab, text="📊 Resultado")
+        result_tab = ttk.Frame(self.notebook)
+        self.notebook.add(result_tab, text="📊 Resultado")
         
         self.projection_label = ttk.Label(
             result_tab, 
@@ -95,11 +164,11 @@ class VectorProjectionApp:
         self.projection_label.pack(anchor=tk.W, pady=5)
         
         # Explicación matemática
-        explanation_tab = ttk.Frame(notebook)
-        notebook.add(explanation_tab, text="📚 Explicación")
+        self.explanation_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.explanation_tab, text="📚 Explicación")
         
         self.explanation_text = scrolledtext.ScrolledText(
-            explanation_tab,
+            self.explanation_tab,
             width=60,
             height=10,
             font=('Segoe UI', 9),
@@ -113,15 +182,18 @@ class VectorProjectionApp:
         self.explanation_text.insert(tk.END, "Ingrese dos vectores en ℝⁿ para calcular la proyección...")
         self.explanation_text.config(state=tk.DISABLED)
         
-        # Gráfico
-        graph_tab = ttk.Frame(notebook)
-        notebook.add(graph_tab, text="📈 Gráfico")
-        
-        self.figure = Figure(figsize=(6, 4), dpi=100)
-        self.ax = self.figure.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.figure, master=graph_tab)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        self.draw_empty_plot()
+        # Gráfico: la figura se crea al dibujar por primera vez (ver ensure_figure)
+        self.graph_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.graph_tab, text="📈 Gráfico")
+
+        self.figure = None
+        self.graph_placeholder = ttk.Label(
+            self.graph_tab,
+            text="Ingrese dos vectores\npara visualizar la proyección",
+            foreground='gray',
+            justify=tk.CENTER
+        )
+        self.graph_placeholder.pack(expand=True)
         
         # Footer con créditos
         footer_frame = ttk.Frame(main_frame)
@@ -133,114 +205,108 @@ class VectorProjectionApp:
             style='Footer.TLabel'
         ).pack(side=tk.RIGHT)
     
+    def set_busy(self, busy):
+        """Muestra u oculta el indicador mientras el worker calcula"""
+        if busy:
+            self.busy_bar.pack(side=tk.LEFT, padx=5)
+            self.busy_bar.start(10)
+            self.root.config(cursor='watch')
+        else:
+            self.busy_bar.stop()
+            self.busy_bar.pack_forget()
+            self.root.config(cursor='')
+
+    def on_destroy(self, event):
+        if event.widget is self.root:
+            self.worker.shutdown()
+
+    def ensure_figure(self):
+        """Crea la figura en el primer dibujo; matplotlib solo se importa entonces"""
+        if self.figure is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from plot_scenes import ProjectionScene
+
+        self.graph_placeholder.destroy()
+        self.figure = Figure(figsize=(6, 4), dpi=100)
+        self.ax = self.figure.add_subplot(111)
+        self.scene = ProjectionScene(self.ax)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_tab)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.draw_trace.connect(self.canvas)
+
     def draw_empty_plot(self):
-        self.ax.clear()
-        self.ax.set_title("Esperando datos de vectores...", pad=20)
-        self.ax.text(0.5, 0.5, "Ingrese dos vectores\npara visualizar la proyección", 
-                    ha='center', va='center', fontsize=10, color='gray')
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        self.canvas.draw()
+        self.live.displayed_key = None
+        if self.figure is None:
+            # Aún no se ha dibujado nada: el texto de espera sigue visible
+            return
+        self.scene.show_empty()
+        self.canvas.draw_idle()
     
     def draw_projection(self, a, b, projection):
-        self.ax.clear()
-        
-        # Configuración del gráfico
-        self.ax.set_title("Proyección Ortogonal", pad=20)
-        self.ax.set_xlabel('Eje X')
-        self.ax.set_ylabel('Eje Y')
-        
-        # Ajustar límites según los vectores
-        max_val = max(max(np.abs(a)), max(np.abs(b)), max(np.abs(projection))) * 1.2
-        self.ax.set_xlim([-max_val, max_val])
-        self.ax.set_ylim([-max_val, max_val])
-        
-        # Dibujar los vectores
-        origin = [0, 0]
-        self.ax.quiver(*origin, *a[:2], color='r', angles='xy', scale_units='xy', scale=1, 
-                      width=0.005, label=f'Vector a = {a[:2]}...')
-        self.ax.quiver(*origin, *b[:2], color='b', angles='xy', scale_units='xy', scale=1,
-                      width=0.005, label=f'Vector b = {b[:2]}...')
-        self.ax.quiver(*origin, *projection[:2], color='g', angles='xy', scale_units='xy', scale=1,
-                      width=0.005, label=f'Proyección = {projection[:2]}...')
-        
-        # Dibujar línea punteada para la proyección
-        self.ax.plot([a[0], projection[0]], [a[1], projection[1]], 'k--', linewidth=0.5)
-        
-        # Cuadrícula y leyenda
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-        self.ax.legend()
-        
-        # Nota si los vectores tienen más de 2 dimensiones
-        if len(a) > 2 or len(b) > 2:
-            self.ax.text(0.05, 0.95, "Nota: Mostrando solo las primeras 2 dimensiones", 
-                        transform=self.ax.transAxes, fontsize=8, color='gray')
-        
-        self.canvas.draw()
-    
-    def calculate_projection(self):
-        try:
-            # Obtener y validar vectores
-            a = np.array([float(x) for x in self.vector_a.get().split(",")])
-            b = np.array([float(x) for x in self.vector_b.get().split(",")])
-            
-            if a.shape != b.shape:
-                raise ValueError("Los vectores deben tener la misma dimensión")
-            
-            # Calcular proyección
-            dot_product = np.dot(a, b)
-            b_norm_squared = np.dot(b, b)
-            
-            if b_norm_squared == 0:
-                raise ValueError("El vector b no puede ser el vector cero")
-            
-            projection = (dot_product / b_norm_squared) * b
-            
-            # Mostrar resultados
-            self.projection_label.config(text=f"Proyección: {np.array_str(projection, precision=6)}", foreground='#27ae60')
-            
-            # Explicación matemática
-            explanation = self.generate_explanation(a, b, dot_product, b_norm_squared, projection)
-            self.explanation_text.config(state=tk.NORMAL)
-            self.explanation_text.delete(1.0, tk.END)
-            self.explanation_text.insert(tk.END, explanation)
-            self.explanation_text.config(state=tk.DISABLED)
-            
-            # Dibujar proyección (solo mostramos 2D para simplificar)
-            self.draw_projection(a, b, projection)
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Datos inválidos: {str(e)}\n\nFormato correcto: 1.0, 2.5, -3.2")
-            self.draw_empty_plot()
-        except Exception as e:
-            messagebox.showerror("Error", f"Error en el cálculo: {str(e)}")
-            self.draw_empty_plot()
+        self.ensure_figure()
+        # Las flechas, la línea y la leyenda se actualizan en su sitio (ver plot_scenes)
+        self.scene.update(a, b, projection)
+        self.canvas.draw_idle()
     
-    def generate_explanation(self, a, b, dot_product, b_norm_squared, projection):
-        explanation = "📐 EXPLICACIÓN MATEMÁTICA DE LA PROYECCIÓN\n\n"
-        explanation += "Fórmula: proj_b a = (a·b / b·b) * b\n\n"
-        
-        explanation += f"1️⃣ Producto punto (a·b):\n"
-        explanation += f"   {a} · {b} = {dot_product:.6f}\n\n"
-        
-        explanation += f"2️⃣ Norma al cuadrado de b (b·b):\n"
-        explanation += f"   {b} · {b} = {b_norm_squared:.6f}\n\n"
-        
-        explanation += f"3️⃣ Factor escalar (a·b / b·b):\n"
-        explanation += f"   {dot_product:.6f} / {b_norm_squared:.6f} = {dot_product/b_norm_squared:.6f}\n\n"
-        
-        explanation += f"4️⃣ Proyección resultante:\n"
-        explanation += f"   {dot_product/b_norm_squared:.6f} * {b} = {np.array_str(projection, precision=6)}\n\n"
-        
-        explanation += "🔍 Interpretación geométrica:\n"
-        explanation += "La proyección ortogonal representa la 'sombra' del vector a sobre el vector b.\n"
-        explanation += "- Si los vectores son ortogonales (a·b = 0), la proyección será el vector cero.\n"
-        explanation += "- Si los vectores son paralelos, la proyección será el mismo vector a.\n"
-        explanation += "- La diferencia a - proj_b a es ortogonal al vector b."
-        
-        return explanation
+    def compute_projection(self, key, a, b):
+        """Calcula la proyección; se ejecuta fuera del hilo de Tk"""
+        if a.shape != b.shape:
+            raise ValueError("Los vectores deben tener la misma dimensión")
+
+        cached = shared_cache.get(key)
+        if cached is None:
+            projection, dot_product, b_norm_squared, _ = calcular_proyeccion(a, b)
+            cached = (projection, dot_product, b_norm_squared)
+            shared_cache.put(key, cached)
+        return key, a, b, cached
+
+    def show_projection(self, result, trace):
+        _, a, b, (projection, dot_product, b_norm_squared) = result
+
+        # Mostrar resultados
+        self.projection_label.config(text=f"Proyección: {format_array(projection, precision=6)}", foreground='#27ae60')
+        trace.mark("resultado")
+
+        # Explicación matemática: se construye al mostrar su pestaña
+        self.pending_explanation = (a, b, dot_product, b_norm_squared, projection)
+        self.update_explanation()
+        trace.mark("explicacion")
+
+        # Dibujar proyección (solo mostramos 2D para simplificar)
+        self.draw_projection(a, b, projection)
+        trace.mark("grafico")
+        self.draw_trace.wait(trace)
+
+    def update_explanation(self):
+        """Escribe la explicación pendiente si su pestaña está visible"""
+        if self.pending_explanation is None or self.notebook.select() != str(self.explanation_tab):
+            return
+        explanation = generate_explanation(*self.pending_explanation)
+        self.pending_explanation = None
+
+        self.explanation_text.config(state=tk.NORMAL)
+        self.explanation_text.delete(1.0, tk.END)
+        self.explanation_text.insert(tk.END, explanation)
+        self.explanation_text.config(state=tk.DISABLED)
+
+    def show_status(self, text):
+        """Línea de estado con los errores del modo en vivo"""
+        self.status_label.config(text=text)
+
+    def show_error(self, e):
+        if isinstance(e, ValueError):
+            messagebox.showerror("Error", f"Datos inválidos: {str(e)}\n\nFormato correcto: 1.0, 2.5, -3.2", parent=self.root)
+        else:
+            messagebox.showerror("Error", f"Error en el cálculo: {str(e)}", parent=self.root)
+        self.draw_empty_plot()
     
     def clear_fields(self):
+        # Descartar un cálculo que aún esté en curso
+        self.live.cancel()
+        self.pending_explanation = None
+
         # Limpiar los campos de entrada
         self.vector_a.set("")
         self.vector_b.set("")
@@ -1,5 +1,16 @@
+import argparse
+import hashlib
 import numpy as np
+from batch_io import add_batch_arguments, run_batch
+from instrumentation import enable as enable_metrics, instrumented, write_snapshot
+from text_format import format_array
+from vector_parser import parse_vector
 
+# Factorizaciones de bases usadas por proyectar_en_subespacio, de la más antigua a la más reciente
+MAX_FACTORIZACIONES = 32
+_FACTORIZACIONES = {}
+
+@instrumented
 def calcular_proyeccion(a, b):
     """Calcula la proyección ortogonal de a sobre b"""
     producto_punto = np.dot(a, b)
@@ -13,18 +24,103 @@ def calcular_proyeccion(a, b):
     
     return proyeccion, producto_punto, norma_b_cuadrado, factor_escalar
 
+@instrumented
+def calcular_proyecciones(a, b, devolver_mascara=False):
+    """Calcula en lote las proyecciones ortogonales de las filas de a sobre b
+
+    a es un arreglo (N, d); b puede ser un único vector (d,) o un arreglo (N, d).
+    Devuelve las mismas cuatro cantidades que calcular_proyeccion, como arreglos
+    con una entrada por fila. Las filas cuyo b es el vector cero no lanzan error:
+    su factor escalar y su proyección quedan en NaN. Con devolver_mascara=True se
+    añade además la máscara booleana de esas filas.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if a.ndim == 1:
+        a = a[np.newaxis, :]
+    if a.ndim != 2 or b.ndim not in (1, 2):
+        raise ValueError("a debe ser un arreglo (N, d) y b un vector (d,) o un arreglo (N, d)")
+    if b.shape[-1] != a.shape[1] or (b.ndim == 2 and b.shape[0] != a.shape[0]):
+        raise ValueError(f"Dimensiones incompatibles: a {a.shape}, b {b.shape}")
+
+    if b.ndim == 1:
+        # Un único b: su norma se calcula una sola vez
+        productos_punto = a @ b
+        normas_b_cuadrado = np.full(a.shape[0], np.dot(b, b))
+    else:
+        productos_punto = np.einsum('ij,ij->i', a, b)
+        normas_b_cuadrado = np.einsum('ij,ij->i', b, b)
+
+    b_cero = normas_b_cuadrado == 0
+    factores_escalares = np.divide(
+        productos_punto, normas_b_cuadrado,
+        out=np.full(a.shape[0], np.nan), where=~b_cero
+    )
+    proyecciones = factores_escalares[:, np.newaxis] * b
+
+    if devolver_mascara:
+        return proyecciones, productos_punto, normas_b_cuadrado, factores_escalares, b_cero
+    return proyecciones, productos_punto, normas_b_cuadrado, factores_escalares
+
+def _factorizar_base(base):
+    """Devuelve la matriz (k, d) que lleva cada a a sus coeficientes en la base
+
+    Se obtiene de la factorización QR de la base (B^T = QR, coeficientes =
+    R⁻¹ Qᵀ a) y se guarda en caché según el contenido de la base, de modo que
+    proyectar muchos lotes sobre el mismo subespacio la calcula una sola vez.
+    """
+    clave = (base.shape, hashlib.sha1(base.tobytes()).hexdigest())
+    if clave in _FACTORIZACIONES:
+        # Reinsertar la entrada la marca como la usada más recientemente
+        _FACTORIZACIONES[clave] = _FACTORIZACIONES.pop(clave)
+        return _FACTORIZACIONES[clave]
+
+    k, d = base.shape
+    if k == 0:
+        raise ValueError("La base debe contener al menos un vector")
+    q, r = np.linalg.qr(base.T)
+    diagonal = np.abs(np.diag(r))
+    if k > d or diagonal.min() <= 1e-10 * max(diagonal.max(), 1.0):
+        raise ValueError("Los vectores de la base deben ser linealmente independientes")
+    matriz_coeficientes = np.linalg.solve(r, q.T)
+
+    if len(_FACTORIZACIONES) >= MAX_FACTORIZACIONES:
+        del _FACTORIZACIONES[next(iter(_FACTORIZACIONES))]
+    _FACTORIZACIONES[clave] = matriz_coeficientes
+    return matriz_coeficientes
+
+def proyectar_en_subespacio(a, base):
+    """Proyecta los vectores a sobre el subespacio generado por las filas de base
+
+    a puede ser un vector (d,) o un lote (N, d); base es un arreglo (k, d) de
+    vectores linealmente independientes. Devuelve las proyecciones, los
+    residuos (a - proyección, ortogonales al subespacio) y los coeficientes de
+    cada proyección en la base dada.
+    """
+    a = np.asarray(a, dtype=float)
+    base = np.ascontiguousarray(np.atleast_2d(base), dtype=float)
+    if a.shape[-1] != base.shape[1]:
+        raise ValueError(f"Dimensiones incompatibles: a {a.shape}, base {base.shape}")
+
+    matriz_coeficientes = _factorizar_base(base)
+    coeficientes = a @ matriz_coeficientes.T
+    proyecciones = coeficientes @ base
+    residuos = a - proyecciones
+    return proyecciones, residuos, coeficientes
+
 def mostrar_explicacion(a, b, proyeccion, producto_punto, norma_b_cuadrado, factor_escalar):
-    """Muestra una explicación detallada del cálculo"""
+    """Muestra una explicación detallada del cálculo (con los vectores largos resumidos)"""
+    a_texto, b_texto = format_array(a), format_array(b)
     print("\n=== Explicación del cálculo ===")
     print("Fórmula: proj_b a = (a·b / b·b) * b")
     print("\n1. Producto punto (a·b):")
-    print(f"   {a} · {b} = {producto_punto:.6f}")
+    print(f"   {a_texto} · {b_texto} = {producto_punto:.6f}")
     print("\n2. Norma al cuadrado de b (b·b):")
-    print(f"   {b} · {b} = {norma_b_cuadrado:.6f}")
+    print(f"   {b_texto} · {b_texto} = {norma_b_cuadrado:.6f}")
     print("\n3. Factor escalar (a·b / b·b):")
     print(f"   {producto_punto:.6f} / {norma_b_cuadrado:.6f} = {factor_escalar:.6f}")
     print("\n4. Proyección resultante:")
-    print(f"   {factor_escalar:.6f} * {b} = {proyeccion}")
+    print(f"   {factor_escalar:.6f} * {b_texto} = {format_array(proyeccion)}")
     print("\n📝 Interpretación geométrica:")
     print("La proyección ortogonal representa la componente de a en la dirección de b.")
     if np.allclose(proyeccion, a):
@@ -37,14 +133,41 @@ def ingresar_vector(nombre):
     while True:
         entrada = input(f"Ingrese el vector {nombre} (componentes separadas por comas): ").strip()
         try:
-            componentes = [float(x.strip()) for x in entrada.split(",")]
-            if len(componentes) < 1:
-                raise ValueError("El vector debe tener al menos una componente")
-            return np.array(componentes)
+            return parse_vector(entrada)
         except ValueError as e:
             print(f"Error: {e}. Intente nuevamente. Ejemplo: 1, 2.5, -3")
 
-def main():
+def procesar_bloque(bloque):
+    """Procesa un bloque (n, 2d) cuyas filas son a seguido de b
+
+    Cada fila de salida contiene la proyección (d columnas), el producto punto,
+    la norma al cuadrado de b y el factor escalar.
+    """
+    if bloque.shape[1] % 2 != 0:
+        raise ValueError("Cada fila debe contener a y b con el mismo número de componentes")
+    d = bloque.shape[1] // 2
+    proyecciones, productos_punto, normas_b_cuadrado, factores_escalares = \
+        calcular_proyecciones(bloque[:, :d], bloque[:, d:])
+    return np.column_stack([proyecciones, productos_punto, normas_b_cuadrado, factores_escalares])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Calculadora de proyección ortogonal",
+        epilog="En modo por lotes cada fila contiene las componentes de a seguidas de las de b."
+    )
+    add_batch_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.lote:
+        if args.metricas:
+            enable_metrics()
+        try:
+            run_batch(procesar_bloque, args.lote, args.salida, args.tamano_bloque)
+            if args.metricas:
+                write_snapshot(args.metricas)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Error: {e}")
+        return
+
     print("=== Calculadora de Proyección Ortogonal ===")
     print("Instrucciones:")
     print("1. Ingrese dos vectores en ℝⁿ (mismo número de componentes)")
@@ -67,9 +190,9 @@ def main():
         
         # Resultados
         print("\n=== Resultados ===")
-        print(f"Vector a: {a}")
-        print(f"Vector b: {b}")
-        print(f"\n➡️ Proyección de a sobre b: {proyeccion}")
+        print(f"Vector a: {format_array(a)}")
+        print(f"Vector b: {format_array(b)}")
+        print(f"\n➡️ Proyección de a sobre b: {format_array(proyeccion)}")
         
         # Explicación detallada
         mostrar_explicacion(a, b, proyeccion, producto_punto, norma_b_cuadrado, factor_escalar)
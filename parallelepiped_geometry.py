@@ -0,0 +1,77 @@
+"""Vértices y caras de muchos paralelepípedos a la vez
+
+Cada sólido se describe por una base (3, 3) con a, b y c como filas y un
+origen. Sus 8 vértices son origen + i·a + j·b + k·c con i, j, k ∈ {0, 1}, así
+que para una pila (N, 3, 3) de bases todos los vértices salen de un solo
+producto con la tabla VERTEX_COEFFICIENTS, y las caras de indexar con FACES.
+El resultado (6N, 4, 3) se pasa directamente a un Poly3DCollection.
+"""
+import numpy as np
+
+# Coeficientes (i, j, k) de a, b y c para cada vértice:
+# v0 = 0, v1 = a, v2 = a+b, v3 = b, v4 = a+c, v5 = a+b+c, v6 = b+c, v7 = c
+VERTEX_COEFFICIENTS = np.array([
+    [0, 0, 0],
+    [1, 0, 0],
+    [1, 1, 0],
+    [0, 1, 0],
+    [1, 0, 1],
+    [1, 1, 1],
+    [0, 1, 1],
+    [0, 0, 1],
+], dtype=float)
+
+# Índices de vértices de las 6 caras, recorridos en orden alrededor de cada una
+FACES = np.array([
+    [0, 1, 2, 3],  # base (a, b)
+    [7, 4, 5, 6],  # tapa (a, b) desplazada por c
+    [0, 1, 4, 7],  # cara (a, c)
+    [3, 2, 5, 6],  # cara (a, c) desplazada por b
+    [0, 3, 6, 7],  # cara (b, c)
+    [1, 2, 5, 4],  # cara (b, c) desplazada por a
+])
+
+def _as_bases(bases):
+    bases = np.asarray(bases, dtype=float)
+    if bases.ndim == 2:
+        bases = bases[np.newaxis]
+    if bases.ndim != 3 or bases.shape[1:] != (3, 3):
+        raise ValueError("Las bases deben tener forma (3, 3) o (N, 3, 3)")
+    return bases
+
+def parallelepiped_vertices(bases, origins=None):
+    """Vértices (N, 8, 3) de los paralelepípedos de una pila de bases (N, 3, 3)
+
+    origins, opcional, es un punto (3,) o una pila (N, 3) que desplaza cada
+    sólido. Una sola base (3, 3) se repite para todos los orígenes, como en
+    parallelepiped_vertices(base, lattice_origins(base, forma)).
+    """
+    bases = _as_bases(bases)
+    vertices = np.einsum('vk,nkd->nvd', VERTEX_COEFFICIENTS, bases)
+    if origins is None:
+        return vertices
+    origins = np.asarray(origins, dtype=float)
+    if origins.ndim == 1:
+        origins = origins[np.newaxis]
+    if origins.ndim != 2 or origins.shape[1] != 3:
+        raise ValueError("Los orígenes deben tener forma (3,) o (N, 3)")
+    if len(bases) != len(origins) and 1 not in (len(bases), len(origins)):
+        raise ValueError(f"Hay {len(bases)} bases y {len(origins)} orígenes")
+    return vertices + origins[:, np.newaxis, :]
+
+def faces_from_vertices(vertices):
+    """Polígonos (6N, 4, 3) de las caras a partir de los vértices (N, 8, 3)"""
+    return vertices[:, FACES].reshape(-1, 4, 3)
+
+def parallelepiped_faces(bases, origins=None):
+    """Polígonos (6N, 4, 3) de las caras de todos los sólidos, listos para set_verts"""
+    return faces_from_vertices(parallelepiped_vertices(bases, origins))
+
+def lattice_origins(basis, shape):
+    """Orígenes (N, 3) de las celdas de una red de shape = (n_a, n_b, n_c) celdas
+
+    Las celdas recorren la red con el índice de c variando más rápido.
+    """
+    basis = np.asarray(basis, dtype=float).reshape(3, 3)
+    indices = np.indices(shape).reshape(3, -1).T
+    return indices @ basis
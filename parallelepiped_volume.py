@@ -1,9 +1,35 @@
-import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from background_worker import BackgroundWorker
+from latency_trace import DrawTraceHook, install_diagnostics, tracer
+from live_calculation import LiveCalculation
+from parallelepiped_volume_console import calcular_volumen
+from result_cache import shared_cache
+from text_format import format_array
+from window_style import WindowStyle
+
+def generate_explanation(a, b, c, cross_product, scalar_triple, volume):
+    """Explicación paso a paso del volumen mediante el producto triple"""
+    a_text, b_text, c_text = format_array(a), format_array(b), format_array(c)
+    cross_text = format_array(cross_product)
+    parts = [
+        "📐 EXPLICACIÓN MATEMÁTICA DEL VOLUMEN\n\n",
+        "Fórmula del volumen: V = |a · (b × c)|\n\n",
+
+        "1️⃣ Producto vectorial (b × c):\n",
+        f"   b × c = {b_text} × {c_text} = {cross_text}\n\n",
+
+        "2️⃣ Producto escalar (a · (b × c)):\n",
+        f"   a · (b × c) = {a_text} · {cross_text} = {scalar_triple:.6f}\n\n",
+
+        "3️⃣ Volumen absoluto:\n",
+        f"   V = |{scalar_triple:.6f}| = {volume:.6f}\n\n",
+
+        "🔍 Interpretación geométrica:\n",
+        "El valor absoluto del producto triple escalar representa el volumen del paralelepípedo formado por los tres vectores.\n",
+        "Si el volumen es cero, los vectores son coplanares (linealmente dependientes).",
+    ]
+    return "".join(parts)
 
 class ParallelepipedApp:
     def __init__(self, root):
@@ -12,8 +38,8 @@ class ParallelepipedApp:
         self.root.geometry("900x750")
         self.root.resizable(True, True)
         
-        # Configuración de estilo
-        self.style = ttk.Style()
+        # Configuración de estilo, propia de esta ventana (ver window_style)
+        self.style = WindowStyle(self.root)
         self.style.theme_use('clam')
         self.style.configure('TFrame', background='#f0f2f5')
         self.style.configure('TLabel', background='#f0f2f5', font=('Segoe UI', 10))
@@ -26,9 +52,30 @@ class ParallelepipedApp:
         self.vector_a = tk.StringVar()
         self.vector_b = tk.StringVar()
         self.vector_c = tk.StringVar()
-        
+
+        # Datos de la explicación aún no escrita (se escribe al abrir su pestaña)
+        self.pending_explanation = None
+
+        # Modo en vivo: se recalcula al escribir, tras una breve espera sin pulsaciones
+        self.live_mode = tk.BooleanVar(value=True)
+
+        # Los cálculos se ejecutan fuera del hilo de Tk (ver background_worker)
+        self.worker = BackgroundWorker(self.root, on_busy=self.set_busy)
+        self.root.bind("<Destroy>", self.on_destroy, add="+")
+
+        # Trazas de latencia por fase (Ctrl+Shift+D abre el panel de diagnóstico)
+        self.draw_trace = DrawTraceHook(tracer)
+        install_diagnostics(self.root)
+
+        # Análisis de los campos y envío al worker, en vivo o con el botón (ver live_calculation)
+        self.live = LiveCalculation(
+            self.root, self.worker, (self.vector_a, self.vector_b, self.vector_c), self.live_mode, "volumen",
+            self.compute_volume, self.show_volume, self.show_error, self.show_status
+        )
+
         # Widgets
         self.create_widgets()
+        self.style.apply(self.root)
     
     def create_widgets(self):
         # Frame principal
@@ -67,7 +114,7 @@ class ParallelepipedApp:
         ttk.Button(
             button_frame,
             text="📊 Calcular Volumen",
-            command=self.calculate_volume,
+            command=self.live.calculate,
             style='TButton'
         ).pack(side=tk.LEFT, padx=5)
         
@@ -78,17 +125,34 @@ class ParallelepipedApp:
             command=self.clear_fields,
             style='TButton'
         ).pack(side=tk.LEFT, padx=5)
+
+        # Casilla del modo en vivo
+        ttk.Checkbutton(
+            button_frame,
+            text="⚡ Cálculo en vivo",
+            variable=self.live_mode,
+            command=self.live.on_input_changed
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Indicador de cálculo en curso: solo visible mientras trabaja el worker
+        self.busy_bar = ttk.Progressbar(button_frame, mode='indeterminate', length=100)
+
+        # Errores del modo en vivo (sin ventanas emergentes mientras se escribe)
+        self.status_label = ttk.Label(input_panel, text="", foreground='#e74c3c')
+        self.status_label.grid(row=4, column=0, columnspan=2, sticky=tk.W)
         
         # Resultados
         results_frame = ttk.LabelFrame(main_frame, text=" Resultados ", padding=10)
         results_frame.pack(fill=tk.BOTH, pady=5, expand=True)
         
-        notebook = ttk.Notebook(results_frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = ttk.Notebook(results_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        # La explicación se construye solo cuando su pestaña está a la vista
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.update_explanation())
         
         # Pestaña de resultados
-        result_tab = ttk.Frame(notebook)
-        notebook.add(result_tab, text="📋 Resultado")
+        result_tab = ttk.Frame(self.notebook)
+        self.notebook.add(result_tab, text="📋 Resultado")
         
         self.volume_label = ttk.Label(
             result_tab, 
@@ -99,11 +163,11 @@ class ParallelepipedApp:
         self.volume_label.pack(anchor=tk.W, pady=5)
         
         # Explicación matemática
-        explanation_tab = ttk.Frame(notebook)
-        notebook.add(explanation_tab, text="📚 Explicación")
+        self.explanation_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.explanation_tab, text="📚 Explicación")
         
         self.explanation_text = scrolledtext.ScrolledText(
-            explanation_tab,
+            self.explanation_tab,
             width=60,
             height=10,
             font=('Segoe UI', 9),
@@ -117,15 +181,18 @@ class ParallelepipedApp:
         self.explanation_text.insert(tk.END, "Ingrese tres vectores en ℝ³ para calcular el volumen...")
         self.explanation_text.config(state=tk.DISABLED)
         
-        # Gráfico 3D
-        graph_tab = ttk.Frame(notebook)
-        notebook.add(graph_tab, text="📐 Gráfico 3D")
-        
-        self.figure = Figure(figsize=(6, 4), dpi=100)
-        self.ax = self.figure.add_subplot(111, projection='3d')
-        self.canvas = FigureCanvasTkAgg(self.figure, master=graph_tab)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        self.draw_empty_plot()
+        # Gráfico 3D: la figura se crea al dibujar por primera vez (ver ensure_figure)
+        self.graph_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.graph_tab, text="📐 Gráfico 3D")
+
+        self.figure = None
+        self.graph_placeholder = ttk.Label(
+            self.graph_tab,
+            text="Ingrese 3 vectores\npara visualizar",
+            foreground='gray',
+            justify=tk.CENTER
+        )
+        self.graph_placeholder.pack(expand=True)
         
         # Footer con créditos
         footer_frame = ttk.Frame(main_frame)
@@ -137,119 +204,109 @@ class ParallelepipedApp:
             style='Footer.TLabel'
         ).pack(side=tk.RIGHT)
     
+    def set_busy(self, busy):
+        """Muestra u oculta el indicador mientras el worker calcula"""
+        if busy:
+            self.busy_bar.pack(side=tk.LEFT, padx=5)
+            self.busy_bar.start(10)
+            self.root.config(cursor='watch')
+        else:
+            self.busy_bar.stop()
+            self.busy_bar.pack_forget()
+            self.root.config(cursor='')
+
+    def on_destroy(self, event):
+        if event.widget is self.root:
+            self.worker.shutdown()
+
+    def ensure_figure(self):
+        """Crea la figura en el primer dibujo; matplotlib solo se importa entonces"""
+        if self.figure is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from plot_scenes import ParallelepipedScene
+
+        self.graph_placeholder.destroy()
+        self.figure = Figure(figsize=(6, 4), dpi=100)
+        self.ax = self.figure.add_subplot(111, projection='3d')
+        self.scene = ParallelepipedScene(self.ax)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_tab)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.draw_trace.connect(self.canvas)
+
     def draw_empty_plot(self):
-        self.ax.clear()
-        self.ax.set_title("Esperando datos...", pad=20)
-        self.ax.set_xlabel('Eje X')
-        self.ax.set_ylabel('Eje Y')
-        self.ax.set_zlabel('Eje Z')
-        self.ax.text(0, 0, 0, "Ingrese 3 vectores\npara visualizar", 
-                    ha='center', va='center', fontsize=10, color='gray')
-        self.canvas.draw()
+        self.live.displayed_key = None
+        if self.figure is None:
+            # Aún no se ha dibujado nada: el texto de espera sigue visible
+            return
+        self.scene.show_empty()
+        self.canvas.draw_idle()
     
     def draw_parallelepiped(self, a, b, c):
-        self.ax.clear()
-        
-        # Vértices del paralelepípedo
-        vertices = [
-            [0, 0, 0],
-            a,
-            [a[0]+b[0], a[1]+b[1], a[2]+b[2]],
-            b,
-            [a[0]+c[0], a[1]+c[1], a[2]+c[2]],
-            [a[0]+b[0]+c[0], a[1]+b[1]+c[1], a[2]+b[2]+c[2]],
-            [b[0]+c[0], b[1]+c[1], b[2]+c[2]],
-            c
-        ]
-        
-        # Definir las 6 caras del paralelepípedo
-        faces = [
-            [vertices[0], vertices[1], vertices[4], vertices[3]],
-            [vertices[1], vertices[2], vertices[5], vertices[4]],
-            [vertices[2], vertices[6], vertices[7], vertices[5]],
-            [vertices[3], vertices[4], vertices[7], vertices[6]],
-            [vertices[0], vertices[1], vertices[2], vertices[3]],
-            [vertices[4], vertices[5], vertices[7], vertices[6]]
-        ]
-        
-        # Dibujar las caras
-        face_collection = Poly3DCollection(faces, alpha=0.25, linewidths=1, edgecolor='k')
-        face_collection.set_facecolor('cyan')
-        self.ax.add_collection3d(face_collection)
-        
-        # Dibujar los vectores
-        origin = [0, 0, 0]
-        self.ax.quiver(*origin, *a, color='r', arrow_length_ratio=0.1, label=f'a = {a}')
-        self.ax.quiver(*origin, *b, color='g', arrow_length_ratio=0.1, label=f'b = {b}')
-        self.ax.quiver(*origin, *c, color='b', arrow_length_ratio=0.1, label=f'c = {c}')
-        
-        # Configurar el gráfico
-        max_val = max(max(abs(val) for val in vector) for vector in [a, b, c]) * 1.5
-        self.ax.set_xlim([-max_val, max_val])
-        self.ax.set_ylim([-max_val, max_val])
-        self.ax.set_zlim([-max_val, max_val])
-        self.ax.set_title("Paralelepípedo formado por los vectores", pad=20)
-        self.ax.set_xlabel('Eje X')
-        self.ax.set_ylabel('Eje Y')
-        self.ax.set_zlabel('Eje Z')
-        self.ax.legend()
-        
-        self.canvas.draw()
+        self.ensure_figure()
+        # Caras, flechas y leyenda se actualizan en su sitio (ver plot_scenes)
+        self.scene.update(a, b, c)
+        self.canvas.draw_idle()
     
-    def calculate_volume(self):
-        try:
-            # Obtener y validar vectores
-            a = np.array([float(x) for x in self.vector_a.get().split(",")])
-            b = np.array([float(x) for x in self.vector_b.get().split(",")])
-            c = np.array([float(x) for x in self.vector_c.get().split(",")])
-            
-            if a.shape != (3,) or b.shape != (3,) or c.shape != (3,):
-                raise ValueError("Cada vector debe tener exactamente 3 componentes")
-            
-            # Calcular producto triple (a · (b × c))
-            cross_product = np.cross(b, c)
-            scalar_triple = np.dot(a, cross_product)
-            volume = abs(scalar_triple)
-            
-            # Mostrar resultados
-            self.volume_label.config(text=f"Volumen: {volume:.6f} unidades cúbicas", foreground='#27ae60')
-            
-            # Explicación matemática
-            explanation = self.generate_explanation(a, b, c, cross_product, scalar_triple, volume)
-            self.explanation_text.config(state=tk.NORMAL)
-            self.explanation_text.delete(1.0, tk.END)
-            self.explanation_text.insert(tk.END, explanation)
-            self.explanation_text.config(state=tk.DISABLED)
-            
-            # Dibujar paralelepípedo
-            self.draw_parallelepiped(a, b, c)
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Datos inválidos: {str(e)}\n\nFormato correcto: 1.0, 2.5, -3.2")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error en el cálculo: {str(e)}")
+    def compute_volume(self, key, a, b, c):
+        """Calcula el volumen; se ejecuta fuera del hilo de Tk"""
+        if a.shape != (3,) or b.shape != (3,) or c.shape != (3,):
+            raise ValueError("Cada vector debe tener exactamente 3 componentes")
+
+        cached = shared_cache.get(key)
+        if cached is None:
+            # Producto triple (a · (b × c))
+            volume, cross_product, scalar_triple = calcular_volumen(a, b, c)
+            cached = (volume, cross_product, scalar_triple)
+            shared_cache.put(key, cached)
+        return key, a, b, c, cached
+
+    def show_volume(self, result, trace):
+        _, a, b, c, (volume, cross_product, scalar_triple) = result
+
+        # Mostrar resultados
+        self.volume_label.config(text=f"Volumen: {volume:.6f} unidades cúbicas", foreground='#27ae60')
+        trace.mark("resultado")
+
+        # Explicación matemática: se construye al mostrar su pestaña
+        self.pending_explanation = (a, b, c, cross_product, scalar_triple, volume)
+        self.update_explanation()
+        trace.mark("explicacion")
+
+        # Dibujar paralelepípedo
+        self.draw_parallelepiped(a, b, c)
+        trace.mark("grafico")
+        self.draw_trace.wait(trace)
+
+    def update_explanation(self):
+        """Escribe la explicación pendiente si su pestaña está visible"""
+        if self.pending_explanation is None or self.notebook.select() != str(self.explanation_tab):
+            return
+        explanation = generate_explanation(*self.pending_explanation)
+        self.pending_explanation = None
+
+        self.explanation_text.config(state=tk.NORMAL)
+        self.explanation_text.delete(1.0, tk.END)
+        self.explanation_text.insert(tk.END, explanation)
+        self.explanation_text.config(state=tk.DISABLED)
+
+    def show_status(self, text):
+        """Línea de estado con los errores del modo en vivo"""
+        self.status_label.config(text=text)
+
+    def show_error(self, e):
+        if isinstance(e, ValueError):
+            messagebox.showerror("Error", f"Datos inválidos: {str(e)}\n\nFormato correcto: 1.0, 2.5, -3.2", parent=self.root)
+        else:
+            messagebox.showerror("Error", f"Error en el cálculo: {str(e)}", parent=self.root)
             self.draw_empty_plot()
     
-    def generate_explanation(self, a, b, c, cross_product, scalar_triple, volume):
-        explanation = "📐 EXPLICACIÓN MATEMÁTICA DEL VOLUMEN\n\n"
-        explanation += "Fórmula del volumen: V = |a · (b × c)|\n\n"
-        
-        explanation += "1️⃣ Producto vectorial (b × c):\n"
-        explanation += f"   b × c = {b} × {c} = {cross_product}\n\n"
-        
-        explanation += "2️⃣ Producto escalar (a · (b × c)):\n"
-        explanation += f"   a · (b × c) = {a} · {cross_product} = {scalar_triple:.6f}\n\n"
-        
-        explanation += "3️⃣ Volumen absoluto:\n"
-        explanation += f"   V = |{scalar_triple:.6f}| = {volume:.6f}\n\n"
-        
-        explanation += "🔍 Interpretación geométrica:\n"
-        explanation += "El valor absoluto del producto triple escalar representa el volumen del paralelepípedo formado por los tres vectores.\n"
-        explanation += "Si el volumen es cero, los vectores son coplanares (linealmente dependientes)."
-        
-        return explanation
-    
     def clear_fields(self):
+        # Descartar un cálculo que aún esté en curso
+        self.live.cancel()
+        self.pending_explanation = None
+
         # Limpiar los campos de entrada
         self.vector_a.set("")
         self.vector_b.set("")
@@ -1,20 +1,69 @@
+import argparse
 import numpy as np
+from batch_io import add_batch_arguments, run_batch
+from instrumentation import enable as enable_metrics, instrumented, write_snapshot
+from text_format import format_array
+from vec3 import Vec3, small_components
+from vector_parser import parse_vector
 
+@instrumented
 def calcular_volumen(a, b, c):
     """Calcula el volumen del paralelepípedo usando el producto triple escalar"""
+    # Camino rápido para b, c de ℝ³: el producto vectorial en Python puro da los
+    # mismos valores que np.cross con una fracción de su coste. El producto
+    # escalar final se deja a np.dot, cuyo orden de suma no es el de Python.
+    comp_b, comp_c = small_components(b, 3), small_components(c, 3)
+    if comp_b is not None and comp_c is not None and len(comp_b) == len(comp_c) == 3:
+        producto_vectorial = Vec3.from_components(comp_b).cross(Vec3.from_components(comp_c)).to_array()
+        producto_triple = np.dot(a, producto_vectorial)
+        return abs(producto_triple), producto_vectorial, producto_triple
+
     producto_vectorial = np.cross(b, c)
     producto_triple = np.dot(a, producto_vectorial)
     volumen = abs(producto_triple)
     return volumen, producto_vectorial, producto_triple
 
+@instrumented
+def calcular_volumenes(a, b=None, c=None):
+    """Calcula en lote los volúmenes de N paralelepípedos
+
+    Acepta tres arreglos (N, 3) a, b, c, o un único arreglo (N, 3, 3) cuyas filas
+    son a, b y c. Devuelve volúmenes, productos vectoriales (b × c) y productos
+    triples, en el mismo orden que calcular_volumen.
+    """
+    if b is None and c is None:
+        pila = np.asarray(a, dtype=float)
+        if pila.ndim != 3 or pila.shape[1:] != (3, 3):
+            raise ValueError("La pila de vectores debe tener forma (N, 3, 3)")
+        a, b, c = pila[:, 0], pila[:, 1], pila[:, 2]
+    else:
+        a = np.asarray(a, dtype=float)
+        b = np.asarray(b, dtype=float)
+        c = np.asarray(c, dtype=float)
+        if a.ndim != 2 or a.shape[1] != 3 or a.shape != b.shape or a.shape != c.shape:
+            raise ValueError("a, b y c deben ser arreglos (N, 3) de la misma forma")
+
+    # Producto vectorial y producto triple en forma cerrada, por componentes
+    bx, by, bz = b[:, 0], b[:, 1], b[:, 2]
+    cx, cy, cz = c[:, 0], c[:, 1], c[:, 2]
+    productos_vectoriales = np.empty((a.shape[0], 3))
+    productos_vectoriales[:, 0] = by * cz - bz * cy
+    productos_vectoriales[:, 1] = bz * cx - bx * cz
+    productos_vectoriales[:, 2] = bx * cy - by * cx
+    productos_triples = (a[:, 0] * productos_vectoriales[:, 0]
+                         + a[:, 1] * productos_vectoriales[:, 1]
+                         + a[:, 2] * productos_vectoriales[:, 2])
+    volumenes = np.abs(productos_triples)
+    return volumenes, productos_vectoriales, productos_triples
+
 def mostrar_explicacion(a, b, c, p_vectorial, p_triple, volumen):
     """Genera una explicación detallada del cálculo"""
     print("\n=== Explicación del cálculo ===")
     print("Fórmula: V = |a · (b × c)|")
     print("\n1. Producto vectorial (b × c):")
-    print(f"   {b} × {c} = {p_vectorial}")
+    print(f"   {format_array(b)} × {format_array(c)} = {format_array(p_vectorial)}")
     print("\n2. Producto escalar (a · (b × c)):")
-    print(f"   {a} · {p_vectorial} = {p_triple:.6f}")
+    print(f"   {format_array(a)} · {format_array(p_vectorial)} = {p_triple:.6f}")
     print("\n3. Volumen absoluto:")
     print(f"   V = |{p_triple:.6f}| = {volumen:.6f}")
     print("\n📝 Interpretación geométrica:")
@@ -28,14 +77,39 @@ def ingresar_vector(nombre):
     while True:
         entrada = input(f"Ingrese el vector {nombre} (x,y,z): ").strip()
         try:
-            componentes = [float(x.strip()) for x in entrada.split(",")]
-            if len(componentes) != 3:
-                raise ValueError("Debe tener exactamente 3 componentes")
-            return np.array(componentes)
+            return parse_vector(entrada, dim=3)
         except ValueError as e:
             print(f"Error: {e}. Intente nuevamente. Ejemplo: 1.5, -2.0, 3.2")
 
-def main():
+def procesar_bloque(bloque):
+    """Procesa un bloque (n, 9) cuyas filas son a, b y c
+
+    Cada fila de salida contiene el volumen, el producto triple y las tres
+    componentes de b × c.
+    """
+    if bloque.shape[1] != 9:
+        raise ValueError("Cada fila debe contener exactamente 9 componentes (a, b y c)")
+    volumenes, productos_vectoriales, productos_triples = calcular_volumenes(bloque.reshape(-1, 3, 3))
+    return np.column_stack([volumenes, productos_triples, productos_vectoriales])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Calculadora de volumen de paralelepípedo",
+        epilog="En modo por lotes cada fila contiene las componentes de a, b y c (9 valores)."
+    )
+    add_batch_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.lote:
+        if args.metricas:
+            enable_metrics()
+        try:
+            run_batch(procesar_bloque, args.lote, args.salida, args.tamano_bloque)
+            if args.metricas:
+                write_snapshot(args.metricas)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Error: {e}")
+        return
+
     print("=== Calculadora de Volumen de Paralelepípedo ===")
     print("Instrucciones:")
     print("1. Ingrese tres vectores en ℝ³ (3 dimensiones)")
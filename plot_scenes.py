@@ -0,0 +1,298 @@
+"""Escenas de matplotlib que conservan sus artistas entre actualizaciones
+
+Cada escena crea una sola vez sus flechas, caras, textos y leyenda sobre un
+Axes, y después solo actualiza datos, textos y visibilidad. No depende de Tk:
+quien la usa decide cuándo redibujar (draw_idle en las aplicaciones).
+"""
+import numpy as np
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+from parallelepiped_geometry import faces_from_vertices, parallelepiped_faces, parallelepiped_vertices
+
+def arrow_segments(vectors, origin=(0, 0, 0), arrow_length_ratio=0.1, head_angle=15):
+    """Segmentos de flechas 3D (cuerpo y dos trazos de punta), como los de ax.quiver
+
+    Devuelve un arreglo (3N, 2, 3): para cada vector, su cuerpo desde el origen
+    y las dos líneas de la punta.
+    """
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=float))
+    origins = np.broadcast_to(np.asarray(origin, dtype=float), vectors.shape)
+    tips = origins + vectors
+
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    directions = np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > 0)
+    # Eje perpendicular a cada vector para abrir la punta
+    reference = np.where(np.abs(directions[:, 2:3]) < 0.9, [[0.0, 0.0, 1.0]], [[1.0, 0.0, 0.0]])
+    perpendicular = np.cross(directions, reference)
+    perpendicular /= np.maximum(np.linalg.norm(perpendicular, axis=1, keepdims=True), 1e-300)
+
+    angle = np.radians(head_angle)
+    head_length = arrow_length_ratio * lengths
+    back = -np.cos(angle) * directions
+    side = np.sin(angle) * perpendicular
+    head_1 = tips + head_length * (back + side)
+    head_2 = tips + head_length * (back - side)
+
+    segments = np.stack([
+        np.stack([origins, tips], axis=1),
+        np.stack([tips, head_1], axis=1),
+        np.stack([tips, head_2], axis=1),
+    ], axis=1)
+    return segments.reshape(-1, 2, 3)
+
+def _set_axis_labels(ax):
+    ax.set_xlabel('Eje X')
+    ax.set_ylabel('Eje Y')
+    if hasattr(ax, 'set_zlabel'):
+        ax.set_zlabel('Eje Z')
+
+class ProjectionScene:
+    """Gráfico 2D de a, b y la proyección de a sobre b"""
+
+    def __init__(self, ax):
+        self.ax = ax
+        _set_axis_labels(ax)
+        quiver_options = dict(angles='xy', scale_units='xy', scale=1, width=0.005)
+        self.quivers = [
+            ax.quiver(0, 0, 0, 0, color='r', **quiver_options),
+            ax.quiver(0, 0, 0, 0, color='b', **quiver_options),
+            ax.quiver(0, 0, 0, 0, color='g', **quiver_options),
+        ]
+        self.dashed_line, = ax.plot([0, 0], [0, 0], 'k--', linewidth=0.5)
+        self.legend = ax.legend(self.quivers, ['', '', ''])
+        self.note = ax.text(0.05, 0.95, "Nota: Mostrando solo las primeras 2 dimensiones",
+                            transform=ax.transAxes, fontsize=8, color='gray')
+        self.placeholder = ax.text(0.5, 0.5, "Ingrese dos vectores\npara visualizar la proyección",
+                                   transform=ax.transAxes, ha='center', va='center',
+                                   fontsize=10, color='gray')
+        self.data_artists = self.quivers + [self.dashed_line, self.legend, self.note]
+        self.show_empty()
+
+    def show_empty(self):
+        """Oculta los vectores y muestra el texto de espera"""
+        for artist in self.data_artists:
+            artist.set_visible(False)
+        self.placeholder.set_visible(True)
+        self.ax.set_title("Esperando datos de vectores...", pad=20)
+        self.ax.xaxis.label.set_visible(False)
+        self.ax.yaxis.label.set_visible(False)
+        self.ax.tick_params(bottom=False, left=False, labelbottom=False, labelleft=False)
+        self.ax.grid(False)
+
+    def update(self, a, b, projection):
+        """Actualiza flechas, textos y límites para un nuevo cálculo"""
+        vectors = [np.asarray(v, dtype=float) for v in (a, b, projection)]
+        planar = [np.pad(v[:2], (0, max(0, 2 - v.size))) for v in vectors]
+        for quiver, (u, v) in zip(self.quivers, planar):
+            quiver.set_UVC(u, v)
+        labels = [f'Vector a = {vectors[0][:2]}...', f'Vector b = {vectors[1][:2]}...',
+                  f'Proyección = {vectors[2][:2]}...']
+        for text, label in zip(self.legend.get_texts(), labels):
+            text.set_text(label)
+        self.dashed_line.set_data([planar[0][0], planar[2][0]], [planar[0][1], planar[2][1]])
+
+        max_val = max(np.abs(v).max() for v in vectors) * 1.2
+        self.ax.set_xlim([-max_val, max_val])
+        self.ax.set_ylim([-max_val, max_val])
+
+        for artist in self.data_artists:
+            artist.set_visible(True)
+        self.note.set_visible(vectors[0].size > 2 or vectors[1].size > 2)
+        self.placeholder.set_visible(False)
+        self.ax.set_title("Proyección Ortogonal", pad=20)
+        self.ax.xaxis.label.set_visible(True)
+        self.ax.yaxis.label.set_visible(True)
+        self.ax.tick_params(bottom=True, left=True, labelbottom=True, labelleft=True)
+        self.ax.grid(True, linestyle='--', alpha=0.7)
+
+class ParallelepipedScene:
+    """Gráfico 3D del paralelepípedo generado por a, b y c, o de muchos a la vez
+
+    Todas las caras viven en un único Poly3DCollection: update dibuja un sólido
+    con sus flechas y leyenda, update_solids una pila de sólidos (p. ej. una red).
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        _set_axis_labels(ax)
+        self.faces = Poly3DCollection(np.zeros((6, 4, 3)), alpha=0.25, linewidths=1, edgecolor='k')
+        self.faces.set_facecolor('cyan')
+        ax.add_collection3d(self.faces)
+        self.arrows = []
+        for color in ('r', 'g', 'b'):
+            arrow = Line3DCollection(np.zeros((3, 2, 3)), colors=color)
+            ax.add_collection3d(arrow)
+            self.arrows.append(arrow)
+        self.legend = ax.legend(self.arrows, ['', '', ''])
+        self.placeholder = ax.text(0, 0, 0, "Ingrese 3 vectores\npara visualizar",
+                                   ha='center', va='center', fontsize=10, color='gray')
+        self.data_artists = [self.faces, self.legend] + self.arrows
+        self.show_empty()
+
+    def show_empty(self):
+        """Oculta el sólido y muestra el texto de espera"""
+        for artist in self.data_artists:
+            artist.set_visible(False)
+        self.placeholder.set_visible(True)
+        self.ax.set_title("Esperando datos...", pad=20)
+
+    def update(self, a, b, c):
+        """Actualiza caras, flechas, leyenda y límites para nuevos vectores"""
+        a, b, c = (np.asarray(v, dtype=float) for v in (a, b, c))
+        self.faces.set_verts(parallelepiped_faces(np.stack([a, b, c])))
+
+        for arrow, vector in zip(self.arrows, (a, b, c)):
+            arrow.set_segments(arrow_segments(vector))
+        for text, name, vector in zip(self.legend.get_texts(), 'abc', (a, b, c)):
+            text.set_text(f'{name} = {vector}')
+
+        max_val = max(np.abs(v).max() for v in (a, b, c)) * 1.5
+        self.ax.set_xlim([-max_val, max_val])
+        self.ax.set_ylim([-max_val, max_val])
+        self.ax.set_zlim([-max_val, max_val])
+
+        for artist in self.data_artists:
+            artist.set_visible(True)
+        self.placeholder.set_visible(False)
+        self.ax.set_title("Paralelepípedo formado por los vectores", pad=20)
+
+    def update_solids(self, bases, origins=None):
+        """Dibuja N paralelepípedos de una pila de bases (N, 3, 3) con orígenes opcionales
+
+        Una sola base (3, 3) se repite en todos los orígenes (p. ej. los de
+        lattice_origins). Las flechas y la leyenda de un solo sólido se ocultan; los límites
+        abarcan todos los vértices.
+        """
+        vertices = parallelepiped_vertices(bases, origins)
+        if len(vertices) == 0:
+            self.show_empty()
+            return
+        self.faces.set_verts(faces_from_vertices(vertices))
+
+        low, high = vertices.reshape(-1, 3).min(axis=0), vertices.reshape(-1, 3).max(axis=0)
+        center = (low + high) / 2
+        half = max(float((high - low).max()) / 2, 1e-12) * 1.1
+        self.ax.set_xlim([center[0] - half, center[0] + half])
+        self.ax.set_ylim([center[1] - half, center[1] + half])
+        self.ax.set_zlim([center[2] - half, center[2] + half])
+
+        for artist in self.data_artists:
+            artist.set_visible(artist is self.faces)
+        self.placeholder.set_visible(False)
+        self.ax.set_title(f"{len(vertices)} paralelepípedos", pad=20)
+
+class VectorScene:
+    """Gráfico 3D de un conjunto de vectores dibujado con una sola colección de flechas
+
+    Con más de max_arrows vectores solo se dibujan las flechas de mayor norma;
+    el conjunto completo se resume con una nube tenue de sus extremos (como
+    mucho max_points) y un texto. Etiquetas y leyenda solo para pocos vectores.
+    """
+
+    COLORS = ['r', 'g', 'b', 'c', 'm', 'y', 'tab:orange', 'tab:purple', 'tab:brown', 'tab:pink']
+    # Hasta este número de vectores se muestran etiquetas v1, v2, ... y leyenda
+    LABEL_LIMIT = len(COLORS)
+    EMPTY_MESSAGE = "Ingrese vectores de ℝ³\npara visualizar"
+
+    def __init__(self, ax, max_arrows=200, max_points=5000):
+        self.ax = ax
+        self.max_arrows = max_arrows
+        self.max_points = max_points
+        self.text_color = None
+        _set_axis_labels(ax)
+
+        # Todas las flechas en una colección; sus segmentos se reemplazan en cada actualización
+        self.arrows = Line3DCollection(np.zeros((3, 2, 3)))
+        ax.add_collection3d(self.arrows)
+        self.density, = ax.plot([], [], [], linestyle='none', marker='.', markersize=2,
+                                color='gray', alpha=0.2)
+        self.summary = ax.text2D(0.0, 1.0, "", transform=ax.transAxes, va='top', fontsize=8, color='gray')
+        self.labels = []
+        self.legend = None
+        self._legend_count = 0
+        self.placeholder = ax.text(0, 0, 0, self.EMPTY_MESSAGE,
+                                   ha='center', va='center', fontsize=10, color='gray')
+        ax.set_title("Visualización de Vectores 3D", pad=20)
+        self.show_empty()
+
+    def show_empty(self, message=None):
+        """Oculta los vectores y muestra el texto de espera (o message)"""
+        for artist in [self.arrows, self.density, self.summary] + self.labels:
+            artist.set_visible(False)
+        if self.legend is not None:
+            self.legend.set_visible(False)
+        self.placeholder.set_text(message or self.EMPTY_MESSAGE)
+        self.placeholder.set_visible(True)
+
+    def select(self, vectors):
+        """Índices de los vectores con flecha: todos, o los max_arrows de mayor norma"""
+        n = len(vectors)
+        if n <= self.max_arrows:
+            return np.arange(n)
+        norms = np.einsum('ij,ij->i', vectors, vectors)
+        return np.sort(np.argpartition(norms, n - self.max_arrows)[n - self.max_arrows:])
+
+    def update(self, vectors):
+        """Actualiza flechas, etiquetas, resumen y límites para los vectores dados"""
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=float))
+        n = len(vectors)
+        shown = self.select(vectors)
+
+        # Tres segmentos por flecha (cuerpo y punta), coloreados según el índice del vector
+        self.arrows.set_segments(arrow_segments(vectors[shown]))
+        colors = np.asarray(self.COLORS, dtype=object)[shown % len(self.COLORS)]
+        self.arrows.set_color(list(np.repeat(colors, 3)))
+        self.arrows.set_visible(True)
+
+        small = n <= self.LABEL_LIMIT
+        self.update_labels(vectors if small else vectors[:0])
+        self.update_legend(n if small else 0)
+
+        if len(shown) < n:
+            step = -(-n // self.max_points)
+            points = vectors[::step]
+            self.density.set_data_3d(points[:, 0], points[:, 1], points[:, 2])
+            self.summary.set_text(
+                f"Flechas: los {len(shown)} vectores de mayor norma de {n}\n"
+                f"Puntos: extremos de {len(points)} vectores"
+            )
+        self.density.set_visible(len(shown) < n)
+        self.summary.set_visible(len(shown) < n)
+
+        # Ajustar límites de los ejes
+        max_val = np.abs(vectors).max() + 1
+        self.ax.set_xlim([-max_val, max_val])
+        self.ax.set_ylim([-max_val, max_val])
+        self.ax.set_zlim([-max_val, max_val])
+
+        self.placeholder.set_visible(False)
+
+    def update_labels(self, vectors):
+        """Etiqueta v1, v2, ... en el extremo de cada vector; los textos se reutilizan"""
+        while len(self.labels) < len(vectors):
+            self.labels.append(self.ax.text(0, 0, 0, ""))
+        for i, label in enumerate(self.labels):
+            visible = i < len(vectors)
+            label.set_visible(visible)
+            if visible:
+                label.set_position_3d(vectors[i])
+                label.set_text(f"v{i+1}")
+                label.set_color(self.COLORS[i % len(self.COLORS)])
+
+    def update_legend(self, count):
+        """Leyenda con una entrada por vector; solo se rehace si cambia el número de vectores"""
+        if count and count != self._legend_count:
+            from matplotlib.lines import Line2D
+            handles = [Line2D([], [], color=self.COLORS[i % len(self.COLORS)]) for i in range(count)]
+            self.legend = self.ax.legend(handles, [f'Vector {i}' for i in range(1, count + 1)])
+            self._legend_count = count
+            if self.text_color is not None:
+                self.set_text_color(self.text_color)
+        if self.legend is not None:
+            self.legend.set_visible(bool(count))
+
+    def set_text_color(self, color):
+        """Color de la leyenda en el tema actual (las etiquetas conservan el color del vector)"""
+        self.text_color = color
+        if self.legend is not None:
+            for text in self.legend.get_texts():
+                text.set_color(color)
@@ -0,0 +1,110 @@
+import sys
+import threading
+from collections import OrderedDict
+import numpy as np
+
+# Valor por defecto de configure para los límites que no se cambian
+_UNCHANGED = object()
+
+def make_key(operation, *vectors):
+    """Construye una clave normalizada a partir de la operación y los vectores de entrada
+
+    Los vectores se convierten a float64 contiguo; sumar 0.0 convierte -0.0 en
+    0.0 para que entradas numéricamente iguales compartan la misma clave.
+    """
+    parts = [operation]
+    for vector in vectors:
+        vector = np.ascontiguousarray(vector, dtype=np.float64) + 0.0
+        parts.append((vector.shape, vector.tobytes()))
+    return tuple(parts)
+
+def estimate_size(value):
+    """Estimación en bytes de un resultado (arreglos, textos, números y tuplas)"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+class LRUCache:
+    """Caché de resultados con expulsión LRU por número de entradas y/o por bytes"""
+
+    def __init__(self, max_entries=256, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Devuelve el valor guardado para key (y lo marca como reciente) o default"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """Guarda value para key y expulsa las entradas menos usadas si se excede el límite"""
+        size = estimate_size(key) + estimate_size(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Un valor mayor que toda la caché no se guarda
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def configure(self, max_entries=_UNCHANGED, max_bytes=_UNCHANGED):
+        """Cambia los límites indicados (None quita el límite) y expulsa lo que sobre"""
+        with self._lock:
+            if max_entries is not _UNCHANGED:
+                self.max_entries = max_entries
+            if max_bytes is not _UNCHANGED:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Vacía la caché sin reiniciar las estadísticas"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Estadísticas de aciertos, fallos, expulsiones y ocupación"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _evict(self):
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+# Caché compartida por las tres aplicaciones gráficas
+shared_cache = LRUCache(max_entries=256, max_bytes=64 * 1024 * 1024)
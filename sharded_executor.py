@@ -0,0 +1,120 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+MIN_ROWS_PER_SHARD = 4096
+
+def _create_shared(shape, dtype):
+    """Reserva un bloque de memoria compartida y devuelve (bloque, vista)"""
+    dtype = np.dtype(dtype)
+    nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    block = shared_memory.SharedMemory(create=True, size=nbytes)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+def _attach_shared(spec):
+    """Abre desde un proceso trabajador un bloque creado por el proceso principal"""
+    name, shape, dtype = spec
+    # Los trabajadores comparten el resource_tracker del proceso principal, que
+    # es el dueño del bloque y el único que lo libera con unlink()
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+def _run_shard(function, input_specs, output_specs, start, stop):
+    """Ejecuta function sobre las filas [start, stop) directamente en memoria compartida"""
+    blocks = []
+    try:
+        inputs = []
+        for spec in input_specs:
+            block, array = _attach_shared(spec)
+            blocks.append(block)
+            inputs.append(array[start:stop])
+        outputs = []
+        for spec in output_specs:
+            block, array = _attach_shared(spec)
+            blocks.append(block)
+            outputs.append(array)
+
+        results = function(*inputs)
+        if not isinstance(results, tuple):
+            results = (results,)
+        for output, result in zip(outputs, results):
+            output[start:stop] = result
+        del inputs, outputs, results
+    finally:
+        for block in blocks:
+            block.close()
+
+def run_sharded(function, *arrays, max_workers=None, rows_per_shard=None):
+    """Ejecuta una función por lotes repartiendo las filas entre varios procesos
+
+    function recibe arreglos con las mismas filas iniciales (por ejemplo
+    calcular_proyecciones, calcular_volumenes o check_linear_independence_batch)
+    y devuelve un arreglo o una tupla de arreglos con una fila por fila de
+    entrada. Debe poder serializarse con pickle: una función de módulo o un
+    functools.partial sobre ella. Entradas y salidas viajan por memoria
+    compartida y los resultados se devuelven en el orden original.
+    """
+    arrays = [np.ascontiguousarray(array) for array in arrays]
+    if not arrays:
+        raise ValueError("Se necesita al menos un arreglo de entrada")
+    n_rows = arrays[0].shape[0]
+    if any(array.shape[0] != n_rows for array in arrays):
+        raise ValueError("Todos los arreglos de entrada deben tener el mismo número de filas")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if rows_per_shard is None:
+        rows_per_shard = max(MIN_ROWS_PER_SHARD, -(-n_rows // (4 * max_workers)))
+
+    # Con pocas filas el coste de arrancar procesos supera al del cálculo
+    if max_workers == 1 or n_rows <= rows_per_shard:
+        return function(*arrays)
+
+    # Una fila de prueba determina la forma y el tipo de cada salida
+    probe = function(*(array[:1] for array in arrays))
+    single_output = not isinstance(probe, tuple)
+    if single_output:
+        probe = (probe,)
+
+    blocks = []
+    views = []
+    try:
+        input_specs = []
+        for array in arrays:
+            block, shared = _create_shared(array.shape, array.dtype)
+            blocks.append(block)
+            views.append(shared)
+            shared[...] = array
+            input_specs.append((block.name, array.shape, array.dtype))
+
+        output_specs = []
+        outputs = []
+        for sample in probe:
+            sample = np.asarray(sample)
+            shape = (n_rows,) + sample.shape[1:]
+            block, shared = _create_shared(shape, sample.dtype)
+            blocks.append(block)
+            views.append(shared)
+            output_specs.append((block.name, shape, sample.dtype))
+            outputs.append(shared)
+        del shared
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_shard, function, input_specs, output_specs,
+                                start, min(start + rows_per_shard, n_rows))
+                for start in range(0, n_rows, rows_per_shard)
+            ]
+            for future in futures:
+                future.result()
+
+        results = tuple(output.copy() for output in outputs)
+        del outputs
+    finally:
+        # Las vistas deben soltarse antes de cerrar los bloques
+        views.clear()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return results[0] if single_output else results
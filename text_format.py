@@ -0,0 +1,23 @@
+"""Impresión resumida de arreglos para resultados y explicaciones
+
+str() de NumPy solo resume a partir de 1000 elementos, así que un vector de
+hasta 1000 componentes ocupa decenas de líneas en las etiquetas de resultado y
+en cada paso de las explicaciones. format_array resume mucho antes: por encima
+de SUMMARY_THRESHOLD elementos muestra solo EDGE_ITEMS por extremo de cada
+eje, de modo que los vectores y matrices 3×3 se ven completos y el resto cabe
+en una línea corta.
+"""
+import numpy as np
+
+SUMMARY_THRESHOLD = 12
+EDGE_ITEMS = 3
+
+def format_array(array, precision=None, separator=' '):
+    """Texto de un arreglo con tamaño acotado, igual a str() para arreglos pequeños"""
+    return np.array2string(
+        np.asarray(array),
+        precision=precision,
+        separator=separator,
+        threshold=SUMMARY_THRESHOLD,
+        edgeitems=EDGE_ITEMS
+    )
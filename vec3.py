@@ -0,0 +1,96 @@
+"""Aritmética de vectores pequeños en Python puro
+
+Para un solo cálculo con vectores de 3 componentes, crear arreglos de NumPy y
+despachar sus ufuncs cuesta mucho más que las pocas multiplicaciones que hacen
+falta. Vec3 guarda tres floats en __slots__ y calcula producto escalar,
+vectorial, triple y determinante 3×3 con las mismas operaciones (y en el mismo
+orden) que np.cross y los cálculos en lote (calcular_volumenes,
+check_linear_independence_batch), de modo que el resultado es idéntico.
+np.dot, en cambio, puede sumar en otro orden. small_components decide si una
+entrada puede tomar este camino rápido.
+"""
+import numpy as np
+
+class Vec3:
+    """Vector de ℝ³ inmutable con sus componentes en __slots__
+
+    Las componentes se asignan una sola vez en __init__; después __setattr__
+    lo impide, así que el hash no cambia mientras el vector esté en un dict.
+    """
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Vec3 es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Vec3 es inmutable")
+
+    @classmethod
+    def from_components(cls, components):
+        x, y, z = components
+        return cls(x, y, z)
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __repr__(self):
+        return f"Vec3({self.x!r}, {self.y!r}, {self.z!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other):
+        return Vec3(self.y * other.z - self.z * other.y,
+                    self.z * other.x - self.x * other.z,
+                    self.x * other.y - self.y * other.x)
+
+    def triple(self, b, c):
+        """Producto triple escalar self · (b × c)"""
+        return (self.x * (b.y * c.z - b.z * c.y)
+                + self.y * (b.z * c.x - b.x * c.z)
+                + self.z * (b.x * c.y - b.y * c.x))
+
+    @staticmethod
+    def det3(u, v, w):
+        """Determinante de la matriz 3×3 con u, v y w como columnas
+
+        Misma expresión que el determinante en lote de linear_independence_console.
+        """
+        return (u.x * (v.y * w.z - w.y * v.z)
+                - v.x * (u.y * w.z - w.y * u.z)
+                + w.x * (u.y * v.z - v.y * u.z))
+
+    def to_array(self):
+        return np.array((self.x, self.y, self.z))
+
+def small_components(vector, max_dim=3):
+    """Componentes de vector como lista de floats si admite el camino rápido; si no, None
+
+    Solo se aceptan arreglos 1D de float64 y listas o tuplas de floats de
+    Python con como mucho max_dim componentes, para que el resultado tenga
+    exactamente el mismo tipo y valor que el cálculo con NumPy.
+    """
+    if type(vector) is np.ndarray:
+        if vector.ndim == 1 and vector.dtype == np.float64 and vector.size <= max_dim:
+            return vector.tolist()
+        return None
+    if isinstance(vector, (list, tuple)) and len(vector) <= max_dim:
+        if all(type(x) is float for x in vector):
+            return list(vector)
+    return None
@@ -0,0 +1,56 @@
+import numpy as np
+
+def _describe_error(lines, delimiter, n_columns=None, line_numbers=None):
+    """Localiza la primera componente inválida y describe el error con precisión
+
+    Solo se ejecuta cuando la conversión en C ya ha fallado, así que recorrer
+    los tokens en Python no afecta al caso normal. Con line_numbers cada fila
+    se identifica por su número de línea en el archivo.
+    """
+    for row, line in enumerate(lines, 1):
+        row_name = f"la fila {row}" if line_numbers is None else f"la línea {line_numbers[row - 1]}"
+        tokens = line.split(delimiter)
+        for column, token in enumerate(tokens, 1):
+            try:
+                float(token)
+            except ValueError:
+                where = f"la componente {column}" if len(lines) == 1 and line_numbers is None else f"{row_name}, componente {column}"
+                return f"Valor inválido '{token.strip()}' en {where}"
+        if n_columns is not None and len(tokens) != n_columns:
+            return f"{row_name.capitalize()} tiene {len(tokens)} componentes y se esperaban {n_columns}"
+    return "Formato de vector inválido"
+
+def parse_vector(text, dim=None, delimiter=","):
+    """Convierte una línea 'x, y, z, ...' en un vector float64 contiguo
+
+    Con dim se exige ese número exacto de componentes. Los errores se lanzan
+    como ValueError indicando la componente inválida.
+    """
+    text = text.strip()
+    if not text:
+        raise ValueError("El vector debe tener al menos una componente")
+    try:
+        vector = np.loadtxt([text], delimiter=delimiter, comments=None, dtype=np.float64, ndmin=1)
+    except ValueError:
+        raise ValueError(_describe_error([text], delimiter)) from None
+    if dim is not None and vector.size != dim:
+        raise ValueError(f"Debe tener exactamente {dim} componentes (se recibieron {vector.size})")
+    return vector
+
+def parse_vectors(text, dim=None, delimiter=","):
+    """Convierte un bloque de líneas, un vector por línea, en un arreglo (N, d)
+
+    Las líneas vacías se ignoran. Todas las filas deben tener el mismo número
+    de componentes (dim si se indica).
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if not lines:
+        raise ValueError("No se encontró ningún vector")
+    n_columns = dim if dim is not None else len(lines[0].split(delimiter))
+    try:
+        vectors = np.loadtxt(lines, delimiter=delimiter, comments=None, dtype=np.float64, ndmin=2)
+    except ValueError:
+        raise ValueError(_describe_error(lines, delimiter, n_columns)) from None
+    if vectors.shape[1] != n_columns:
+        raise ValueError(f"Cada vector debe tener exactamente {n_columns} componentes (se recibieron {vectors.shape[1]})")
+    return vectors
@@ -0,0 +1,84 @@
+"""Lista virtualizada: solo dibuja las filas visibles
+
+Un ScrolledText con una línea por elemento crece sin límite y cada insert
+cuesta más cuanto más largo es el texto. VirtualList guarda solo el número de
+filas y pide el texto de cada una (row_text(i)) cuando entra en pantalla, de
+modo que mostrar 10 o 100 000 filas cuesta lo mismo.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+class VirtualList(ttk.Frame):
+    """Lista de solo lectura con desplazamiento, que reutiliza un texto por fila visible"""
+
+    def __init__(self, master, row_text, height=5, row_height=20, font=('Consolas', 10),
+                 bg='white', fg='black'):
+        super().__init__(master)
+        self.row_text = row_text
+        self.row_height = row_height
+        self.font = font
+        self.fg = fg
+        self.count = 0
+        self.first = 0
+        self._items = []
+
+        self.canvas = tk.Canvas(self, height=height * row_height, bg=bg, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", self.render)
+        self.canvas.bind("<MouseWheel>", self.on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self.scroll_to(self.first - 3))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll_to(self.first + 3))
+
+    def visible_rows(self):
+        height = self.canvas.winfo_height()
+        if height <= 1:
+            height = int(self.canvas.cget('height'))
+        return max(1, height // self.row_height)
+
+    def set_count(self, count, scroll_to_end=False):
+        """Cambia el número de filas y redibuja; opcionalmente muestra las últimas"""
+        self.count = count
+        if scroll_to_end:
+            self.first = count - self.visible_rows()
+        self.scroll_to(self.first)
+
+    def scroll_to(self, first):
+        self.first = max(0, min(first, self.count - self.visible_rows()))
+        self.render()
+
+    def yview(self, *args):
+        """Comando de la barra de desplazamiento (moveto / scroll)"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(round(float(args[1]) * self.count)))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (self.visible_rows() if args[2] == 'pages' else 1)
+            self.scroll_to(self.first + step)
+
+    def on_mousewheel(self, event):
+        self.scroll_to(self.first - 3 * int(event.delta / 120))
+
+    def render(self, event=None):
+        rows = self.visible_rows()
+        # Reservar un elemento de texto por fila visible (el pool solo crece al agrandar la vista)
+        while len(self._items) < rows:
+            y = len(self._items) * self.row_height + 2
+            self._items.append(self.canvas.create_text(4, y, anchor=tk.NW, font=self.font, fill=self.fg))
+
+        for slot, item in enumerate(self._items):
+            index = self.first + slot
+            text = self.row_text(index) if slot < rows and index < self.count else ""
+            self.canvas.itemconfigure(item, text=text)
+
+        if self.count:
+            self.scrollbar.set(self.first / self.count, min(1.0, (self.first + rows) / self.count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def set_colors(self, bg, fg):
+        self.fg = fg
+        self.canvas.configure(bg=bg)
+        for item in self._items:
+            self.canvas.itemconfigure(item, fill=fg)
@@ -0,0 +1,83 @@
+"""Estilos de ttk propios de cada ventana
+
+ttk.Style es uno solo por intérprete de Tcl: cuando el lanzador abre las
+aplicaciones como Toplevel en el mismo proceso, configurar 'TButton' o '.'
+desde una ventana cambiaría el lanzador y todas las demás. WindowStyle acepta
+las mismas llamadas que ttk.Style con los nombres de siempre y las traduce a
+nombres con un prefijo único ('Title.TLabel' pasa a 'Title.Ventana1.TLabel'),
+que heredan de los originales lo que la ventana no configura. apply asigna
+esos nombres a los widgets ttk de la ventana una vez creados.
+"""
+import itertools
+from tkinter import ttk
+
+# Clases de widget que reciben un estilo con prefijo y los subestilos que dibujan
+STYLED_CLASSES = {
+    "TFrame": (),
+    "TLabel": (),
+    "TButton": (),
+    "TCheckbutton": (),
+    "TEntry": (),
+    "TLabelframe": ("Label",),
+    "TNotebook": ("Tab",),
+}
+
+_window_numbers = itertools.count(1)
+
+class WindowStyle:
+    """ttk.Style limitado a una ventana
+
+    configure('.') no toca el estilo raíz compartido: se aplica a los estilos
+    de las clases de widget que tiene la ventana (y a las que se le añadan
+    después con apply).
+    """
+
+    def __init__(self, master=None):
+        self._style = ttk.Style(master)
+        self.prefix = f"Ventana{next(_window_numbers)}"
+        self._classes = set()
+        self._root_options = {}
+
+    def name(self, style):
+        """Nombre con el prefijo de la ventana; los estilos de otras clases no cambian"""
+        parts = style.split(".")
+        for i, part in enumerate(parts):
+            if part in STYLED_CLASSES:
+                return ".".join(parts[:i] + [self.prefix] + parts[i:])
+        return style
+
+    def theme_use(self, theme=None):
+        return self._style.theme_use(theme)
+
+    def lookup(self, style, option, state=None, default=None):
+        return self._style.lookup(self.name(style), option, state, default)
+
+    def configure(self, style, query_opt=None, **options):
+        if style == ".":
+            self._root_options.update(options)
+            for widget_class in self._classes:
+                self._configure_class(widget_class, options)
+            return None
+        return self._style.configure(self.name(style), query_opt, **options)
+
+    def map(self, style, query_opt=None, **options):
+        return self._style.map(self.name(style), query_opt, **options)
+
+    def apply(self, widget):
+        """Asigna los estilos con prefijo a widget y a sus descendientes ttk"""
+        widget_class = widget.winfo_class()
+        if isinstance(widget, ttk.Widget) and widget_class in STYLED_CLASSES:
+            style = str(widget.cget("style")) or widget_class
+            if self.prefix not in style.split("."):
+                widget.configure(style=self.name(style))
+            if widget_class not in self._classes:
+                self._classes.add(widget_class)
+                if self._root_options:
+                    self._configure_class(widget_class, self._root_options)
+        for child in widget.winfo_children():
+            self.apply(child)
+
+    def _configure_class(self, widget_class, options):
+        self._style.configure(self.name(widget_class), **options)
+        for substyle in STYLED_CLASSES[widget_class]:
+            self._style.configure(self.name(f"{widget_class}.{substyle}"), **options)